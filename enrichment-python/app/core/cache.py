@@ -1,6 +1,6 @@
 import json
 import asyncio
-from typing import Optional, Any, Union
+from typing import Optional, Any, Union, List, Dict
 from datetime import timedelta
 from cachetools import TTLCache
 import redis.asyncio as redis
@@ -35,7 +35,9 @@ class CacheManager:
             self.redis_client = redis.from_url(
                 settings.get_redis_dsn(),
                 decode_responses=True,
-                socket_timeout=5.0
+                socket_timeout=5.0,
+                socket_keepalive=True,
+                max_connections=32
             )
             await self.redis_client.ping()
             logger.info("CacheManager initialized", type="redis", host=settings.redis_host)
@@ -71,6 +73,68 @@ class CacheManager:
         
         return None
 
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Get many items at once; L2 misses of L1 go out as a single MGET"""
+        if not self.enabled or not keys:
+            return {}
+
+        found = {}
+        missing = []
+        for key in keys:
+            if key in self.l1_cache:
+                found[key] = self.l1_cache[key]
+            else:
+                missing.append(key)
+
+        if missing and self.redis_client:
+            try:
+                raws = await self.redis_client.mget(missing)
+                for key, data in zip(missing, raws):
+                    if data is None:
+                        continue
+                    try:
+                        value = json.loads(data)
+                    except json.JSONDecodeError:
+                        value = data
+                    self.l1_cache[key] = value
+                    found[key] = value
+            except Exception as e:
+                logger.warning("L2 Cache mget error", error=str(e))
+
+        return found
+
+    async def get_raw(self, key: str) -> Optional[str]:
+        """Get a pre-serialized payload without JSON decoding it"""
+        if not self.enabled:
+            return None
+
+        if key in self.l1_cache:
+            return self.l1_cache[key]
+
+        if self.redis_client:
+            try:
+                data = await self.redis_client.get(key)
+                if data is not None:
+                    self.l1_cache[key] = data
+                    return data
+            except Exception as e:
+                logger.warning("L2 Cache error", error=str(e))
+
+        return None
+
+    async def set_raw(self, key: str, value: str, ttl: int = None):
+        """Store a pre-serialized payload verbatim (L1 + L2)"""
+        if not self.enabled:
+            return
+
+        self.l1_cache[key] = value
+
+        if self.redis_client:
+            try:
+                await self.redis_client.setex(key, ttl or settings.cache_ttl, value)
+            except Exception as e:
+                logger.warning("L2 Cache set error", error=str(e))
+
     async def set(self, key: str, value: Any, ttl: int = None):
         """Set item in cache (L1 + L2)"""
         if not self.enabled:
@@ -1,9 +1,16 @@
 import logging
 import sys
+import orjson
 import structlog
 from typing import Any, Dict
 from .config import settings
 
+def _orjson_serializer(obj: Any, **kwargs) -> str:
+    """orjson-backed serializer for structlog's JSONRenderer"""
+    # ~3-5x faster than stdlib json and handles datetimes natively;
+    # default=str keeps odd event values from killing the log line
+    return orjson.dumps(obj, default=str).decode()
+
 def configure_logging():
     """
     Configure structured JSON logging for enterprise observability.
@@ -24,7 +31,7 @@ def configure_logging():
     # If running locally (debug), use readable console output
     if settings.environment == "production" or not settings.debug:
         processors = shared_processors + [
-            structlog.processors.JSONRenderer()
+            structlog.processors.JSONRenderer(serializer=_orjson_serializer)
         ]
     else:
         processors = shared_processors + [
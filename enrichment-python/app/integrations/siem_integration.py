@@ -3,22 +3,181 @@ SIEM/SOAR Integration Hub - Comprehensive security tool integration
 """
 
 import asyncio
-import json
+import copy
 import logging
-import requests
+import os
+import sys
+import threading
+import httpx
+import orjson
 import time
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
 from abc import ABC, abstractmethod
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Shared L2 cache so multi-worker deployments serve one report instead of
+# recomputing per process; optional when running the module standalone
+try:
+    from ..core.cache import cache_manager
+except ImportError:
+    cache_manager = None
+
+_REPORT_CACHE_KEY = 'siem:integration_report'
+
+# One pooled async HTTP client shared by every connector so concurrent
+# SIEM/SOAR calls reuse connections instead of blocking the event loop
+_shared_client: Optional[httpx.AsyncClient] = None
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """Get or create the shared async HTTP client"""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=30.0
+        )
+    return _shared_client
+
+class CircuitBreaker:
+    """Short-circuits calls to an endpoint after repeated failures"""
+
+    def __init__(self, failure_threshold: int = 5, cooldown: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at = 0.0
+
+    def allow(self) -> bool:
+        """Check whether a call may proceed"""
+        if self._failures < self.failure_threshold:
+            return True
+        if time.monotonic() - self._opened_at >= self.cooldown:
+            # Half-open: let one probe call through after the cooldown
+            self._failures = self.failure_threshold - 1
+            return True
+        return False
+
+    def record(self, success: bool):
+        """Record a call outcome, opening the breaker on repeated failure"""
+        if success:
+            self._failures = 0
+        else:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+@retry(stop=stop_after_attempt(3), wait=wait_exponential_jitter(1, 10),
+       retry=retry_if_exception_type(httpx.TransportError), reraise=True)
+async def _post_with_retry(client: httpx.AsyncClient, url: str, headers: Dict[str, str], content: bytes) -> httpx.Response:
+    """POST with exponential-backoff retry on transient transport errors"""
+    return await client.post(url, headers=headers, content=content)
+
+
+# Coarse shared clock: a background task refreshes these every 10ms so hot
+# send paths read cached values instead of making a syscall per event
+_NOW_S = 0
+_NOW_MS = 0
+_NOW_ISO = ''
+_clock_task: Optional[asyncio.Task] = None
+
+async def _refresh_clock():
+    """Refresh the cached coarse clock values every 10ms"""
+    global _NOW_S, _NOW_MS, _NOW_ISO
+    while True:
+        now = time.time()
+        _NOW_S = int(now)
+        _NOW_MS = int(now * 1000)
+        _NOW_ISO = datetime.utcfromtimestamp(now).isoformat()
+        await asyncio.sleep(0.01)
+
+def _ensure_clock():
+    """Start the clock refresher once an event loop is available"""
+    global _clock_task
+    if _clock_task is None or _clock_task.done():
+        try:
+            _clock_task = asyncio.get_running_loop().create_task(_refresh_clock())
+        except RuntimeError:
+            pass
+
+def _now_s() -> int:
+    """Coarse epoch seconds, falling back to a syscall before first refresh"""
+    _ensure_clock()
+    return _NOW_S or int(time.time())
+
+def _now_ms() -> int:
+    """Coarse epoch milliseconds"""
+    _ensure_clock()
+    return _NOW_MS or int(time.time() * 1000)
+
+def _now_iso() -> str:
+    """Coarse ISO-8601 UTC timestamp"""
+    _ensure_clock()
+    return _NOW_ISO or datetime.utcnow().isoformat()
+
+# Worker pool for CPU-bound correlation of large event batches, created
+# lazily so importing the module stays cheap
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+# Batches below this size are cheaper to correlate inline than to ship
+# across process boundaries
+_CORRELATE_OFFLOAD_THRESHOLD = 10_000
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Get or create the shared correlation process pool"""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _process_pool
+
+# Severity ordering for correlation - string max() would compare
+# lexicographically ('medium' > 'high'), which is wrong
+_SEV_RANK = {'info': 0, 'low': 1, 'medium': 2, 'high': 3, 'critical': 4}
+_SEV_NAME = {rank: name for name, rank in _SEV_RANK.items()}
+
+def _correlate_sync(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """CPU-bound correlation body, safe to run in a worker process"""
+    df = pd.DataFrame(records)
+    df['sev_rank'] = df['severity'].map(_SEV_RANK).fillna(_SEV_RANK['medium'])
+
+    grouped = df.groupby(['source', 'event_type'], sort=False).agg(
+        event_count=('id', 'size'),
+        sev_rank=('sev_rank', 'max'),
+        start=('timestamp', 'min'),
+        end=('timestamp', 'max'),
+        events=('id', list)
+    )
+    grouped = grouped[grouped['event_count'] > 1].reset_index()
+
+    correlations = []
+    for row in grouped.itertuples(index=False):
+        correlations.append({
+            'correlation_id': f"corr_{int(time.time())}",
+            'event_count': int(row.event_count),
+            'source': row.source,
+            'event_type': row.event_type,
+            'severity': _SEV_NAME[int(row.sev_rank)],
+            'time_range': {
+                'start': row.start,
+                'end': row.end
+            },
+            'events': row.events,
+            'correlation_score': int(row.event_count) * 0.2
+        })
+
+    return correlations
+
+@dataclass(slots=True)
 class SIEMEvent:
     """Represents a SIEM event"""
     event_id: str
@@ -32,7 +191,18 @@ class SIEMEvent:
     correlation_id: Optional[str] = None
     tags: List[str] = None
 
-@dataclass
+@dataclass(slots=True)
+class SOARAction:
+    """Represents a SOAR action"""
+    action_id: str
+    name: str
+    type: str  # api_call, script, notification, enrichment
+    parameters: Dict[str, Any]
+    timeout: int = 300
+    retry_count: int = 3
+    success_condition: str = "status_code == 200"
+
+@dataclass(slots=True)
 class SOARPlaybook:
     """Represents a SOAR playbook"""
     playbook_id: str
@@ -45,18 +215,49 @@ class SOARPlaybook:
     success_rate: float = 0.0
     execution_count: int = 0
 
-@dataclass
-class SOARAction:
-    """Represents a SOAR action"""
-    action_id: str
-    name: str
-    type: str  # api_call, script, notification, enrichment
-    parameters: Dict[str, Any]
-    timeout: int = 300
-    retry_count: int = 3
-    success_condition: str = "status_code == 200"
+# Free-list of recycled SIEMEvent instances: query paths allocate
+# thousands per response and correlation discards them right after
+# aggregation, so recycling cuts allocator and GC pressure
+_EVENT_POOL: List[SIEMEvent] = []
+_EVENT_POOL_MAX = 10_000
+
+def acquire_event() -> SIEMEvent:
+    """Take a recycled SIEMEvent from the pool, or allocate a fresh one"""
+    if _EVENT_POOL:
+        return _EVENT_POOL.pop()
+    return SIEMEvent.__new__(SIEMEvent)
 
-@dataclass
+def release_event(event: SIEMEvent):
+    """Clear an event's payload fields and return it to the pool"""
+    if len(_EVENT_POOL) < _EVENT_POOL_MAX:
+        event.raw_data = None
+        event.normalized_data = None
+        event.correlation_id = None
+        event.tags = None
+        _EVENT_POOL.append(event)
+
+def _events_from_rows(rows: List[Dict[str, Any]]) -> List[SIEMEvent]:
+    """Build pooled SIEMEvents from parsed query rows in a tight loop"""
+    events = []
+    append = events.append
+    intern = sys.intern
+    for row in rows:
+        event = acquire_event()
+        get = row.get
+        event.event_id = get('id', '')
+        event.timestamp = get('timestamp', '')
+        event.source = intern(get('source', ''))
+        event.event_type = intern(get('event_type', ''))
+        event.severity = intern(get('severity', 'medium'))
+        event.description = get('description', '')
+        event.raw_data = row
+        event.normalized_data = row
+        event.correlation_id = None
+        event.tags = None
+        append(event)
+    return events
+
+@dataclass(slots=True)
 class IntegrationConfig:
     """Represents integration configuration"""
     integration_id: str
@@ -66,7 +267,19 @@ class IntegrationConfig:
     credentials: Dict[str, str]
     settings: Dict[str, Any]
     status: str  # active, inactive, error
-    last_sync: Optional[str] = None
+    # Nanosecond epoch from time.time_ns(); integer compares and JSON
+    # serialization are cheap, formatting happens only on demand
+    last_sync: Optional[int] = None
+    # Derived lookup keys, computed once at registration
+    connector_key: str = ''
+    name_lower: str = ''
+
+    @property
+    def last_sync_iso(self) -> Optional[str]:
+        """ISO-8601 view of last_sync for display consumers"""
+        if self.last_sync is None:
+            return None
+        return datetime.utcfromtimestamp(self.last_sync / 1e9).isoformat()
 
 class SIEMConnector(ABC):
     """Abstract base class for SIEM connectors"""
@@ -81,6 +294,16 @@ class SIEMConnector(ABC):
         """Send event to SIEM"""
         pass
     
+    @abstractmethod
+    def format_event(self, event: SIEMEvent) -> bytes:
+        """Serialize an event into this SIEM's wire format"""
+        pass
+    
+    @abstractmethod
+    async def send_preformatted(self, body: bytes) -> bool:
+        """Send an already serialized event body to the SIEM"""
+        pass
+    
     @abstractmethod
     async def query_events(self, query: str, time_range: Tuple[str, str]) -> List[SIEMEvent]:
         """Query events from SIEM"""
@@ -95,15 +318,18 @@ class SplunkConnector(SIEMConnector):
     """Splunk SIEM connector"""
     
     def __init__(self):
-        self.session = None
+        self.client = None
         self.base_url = None
         self.auth_token = None
+        self._headers_json = None
+        self._headers_form = None
+        self.breaker = CircuitBreaker()
     
     async def connect(self, config: IntegrationConfig) -> bool:
         """Connect to Splunk"""
         try:
             self.base_url = config.endpoint
-            self.session = requests.Session()
+            self.client = _get_shared_client()
             
             # Authenticate with Splunk
             auth_url = f"{self.base_url}/services/auth/login"
@@ -112,9 +338,18 @@ class SplunkConnector(SIEMConnector):
                 'password': config.credentials['password']
             }
             
-            response = self.session.post(auth_url, data=auth_data)
+            response = await self.client.post(auth_url, data=auth_data)
             if response.status_code == 200:
                 self.auth_token = response.text.strip()
+                # Auth token is stable after connect - build headers once
+                self._headers_json = {
+                    'Authorization': f'Splunk {self.auth_token}',
+                    'Content-Type': 'application/json'
+                }
+                self._headers_form = {
+                    'Authorization': f'Splunk {self.auth_token}',
+                    'Content-Type': 'application/x-www-form-urlencoded'
+                }
                 logger.info("Successfully connected to Splunk")
                 return True
             else:
@@ -125,38 +360,63 @@ class SplunkConnector(SIEMConnector):
             logger.error(f"Error connecting to Splunk: {e}")
             return False
     
+    def format_event(self, event: SIEMEvent) -> bytes:
+        """Serialize an event into the Splunk wire format"""
+        return orjson.dumps({
+            'time': _now_s(),
+            'host': event.source,
+            'sourcetype': 'zerotrace',
+            'event': event.normalized_data
+        })
+
+    async def send_preformatted(self, body: bytes) -> bool:
+        """Send an already serialized event body to Splunk"""
+        if not self.breaker.allow():
+            return False
+        try:
+            url = f"{self.base_url}/services/receivers/simple"
+            response = await _post_with_retry(self.client, url, self._headers_json, body)
+            ok = response.status_code == 200
+            self.breaker.record(ok)
+            return ok
+
+        except Exception as e:
+            self.breaker.record(False)
+            logger.error(f"Error sending event to Splunk: {e}")
+            return False
+
     async def send_event(self, event: SIEMEvent) -> bool:
         """Send event to Splunk"""
+        return await self.send_preformatted(self.format_event(event))
+
+    async def send_events_batch(self, events: List[SIEMEvent]) -> bool:
+        """Send a batch of events to Splunk HEC in a single request"""
         try:
-            url = f"{self.base_url}/services/receivers/simple"
-            headers = {
-                'Authorization': f'Splunk {self.auth_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            # Format event for Splunk
-            splunk_event = {
-                'time': int(time.time()),
-                'host': event.source,
-                'sourcetype': 'zerotrace',
-                'event': event.normalized_data
-            }
-            
-            response = self.session.post(url, headers=headers, json=splunk_event)
+            url = f"{self.base_url}/services/collector/event"
+
+            # HEC accepts newline-delimited event objects, so N events
+            # cost one HTTP round-trip instead of N
+            body = b'\n'.join(
+                orjson.dumps({
+                    'time': _now_s(),
+                    'host': event.source,
+                    'sourcetype': 'zerotrace',
+                    'event': event.normalized_data
+                })
+                for event in events
+            )
+
+            response = await self.client.post(url, headers=self._headers_json, content=body)
             return response.status_code == 200
-            
+
         except Exception as e:
-            logger.error(f"Error sending event to Splunk: {e}")
+            logger.error(f"Error sending event batch to Splunk: {e}")
             return False
     
     async def query_events(self, query: str, time_range: Tuple[str, str]) -> List[SIEMEvent]:
         """Query events from Splunk"""
         try:
             url = f"{self.base_url}/services/search/jobs/export"
-            headers = {
-                'Authorization': f'Splunk {self.auth_token}',
-                'Content-Type': 'application/x-www-form-urlencoded'
-            }
             
             data = {
                 'search': query,
@@ -165,26 +425,31 @@ class SplunkConnector(SIEMConnector):
                 'output_mode': 'json'
             }
             
-            response = self.session.post(url, headers=headers, data=data)
-            if response.status_code == 200:
-                events = []
-                for line in response.text.strip().split('\n'):
+            # Stream the export line-by-line - peak memory stays at one
+            # line instead of the whole (potentially huge) response body
+            events = []
+            async with self.client.stream('POST', url, headers=self._headers_form, data=data) as response:
+                if response.status_code != 200:
+                    logger.error(f"Failed to query Splunk: {response.status_code}")
+                    return []
+
+                async for line in response.aiter_lines():
                     if line:
-                        event_data = json.loads(line)
-                        events.append(SIEMEvent(
-                            event_id=event_data.get('_cd', ''),
-                            timestamp=event_data.get('_time', ''),
-                            source=event_data.get('host', ''),
-                            event_type=event_data.get('sourcetype', ''),
-                            severity=event_data.get('severity', 'medium'),
-                            description=event_data.get('_raw', ''),
-                            raw_data=event_data,
-                            normalized_data=event_data
-                        ))
-                return events
-            else:
-                logger.error(f"Failed to query Splunk: {response.status_code}")
-                return []
+                        event_data = orjson.loads(line)
+                        event = acquire_event()
+                        event.event_id = event_data.get('_cd', '')
+                        event.timestamp = event_data.get('_time', '')
+                        event.source = sys.intern(event_data.get('host', ''))
+                        event.event_type = sys.intern(event_data.get('sourcetype', ''))
+                        event.severity = sys.intern(event_data.get('severity', 'medium'))
+                        event.description = event_data.get('_raw', '')
+                        event.raw_data = event_data
+                        event.normalized_data = event_data
+                        event.correlation_id = None
+                        event.tags = None
+                        events.append(event)
+
+            return events
                 
         except Exception as e:
             logger.error(f"Error querying Splunk: {e}")
@@ -199,7 +464,7 @@ class SplunkConnector(SIEMConnector):
                     'alert_id': 'alert_001',
                     'title': 'High severity vulnerability detected',
                     'severity': 'high',
-                    'timestamp': datetime.utcnow().isoformat(),
+                    'timestamp': _now_iso(),
                     'source': 'zerotrace_scanner'
                 }
             ]
@@ -211,15 +476,17 @@ class QRadarConnector(SIEMConnector):
     """IBM QRadar SIEM connector"""
     
     def __init__(self):
-        self.session = None
+        self.client = None
         self.base_url = None
         self.auth_token = None
+        self._headers_json = None
+        self.breaker = CircuitBreaker()
     
     async def connect(self, config: IntegrationConfig) -> bool:
         """Connect to QRadar"""
         try:
             self.base_url = config.endpoint
-            self.session = requests.Session()
+            self.client = _get_shared_client()
             
             # Authenticate with QRadar
             auth_url = f"{self.base_url}/api/auth/login"
@@ -228,9 +495,13 @@ class QRadarConnector(SIEMConnector):
                 'password': config.credentials['password']
             }
             
-            response = self.session.post(auth_url, json=auth_data)
+            response = await self.client.post(auth_url, json=auth_data)
             if response.status_code == 200:
-                self.auth_token = response.json().get('token')
+                self.auth_token = orjson.loads(response.content).get('token')
+                self._headers_json = {
+                    'Authorization': f'Bearer {self.auth_token}',
+                    'Content-Type': 'application/json'
+                }
                 logger.info("Successfully connected to QRadar")
                 return True
             else:
@@ -241,62 +512,50 @@ class QRadarConnector(SIEMConnector):
             logger.error(f"Error connecting to QRadar: {e}")
             return False
     
-    async def send_event(self, event: SIEMEvent) -> bool:
-        """Send event to QRadar"""
+    def format_event(self, event: SIEMEvent) -> bytes:
+        """Serialize an event into the QRadar wire format"""
+        return orjson.dumps({
+            'timestamp': _now_ms(),
+            'source': event.source,
+            'event_type': event.event_type,
+            'severity': event.severity,
+            'description': event.description,
+            'raw_data': event.raw_data
+        })
+
+    async def send_preformatted(self, body: bytes) -> bool:
+        """Send an already serialized event body to QRadar"""
+        if not self.breaker.allow():
+            return False
         try:
             url = f"{self.base_url}/api/events"
-            headers = {
-                'Authorization': f'Bearer {self.auth_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            # Format event for QRadar
-            qradar_event = {
-                'timestamp': int(time.time() * 1000),
-                'source': event.source,
-                'event_type': event.event_type,
-                'severity': event.severity,
-                'description': event.description,
-                'raw_data': event.raw_data
-            }
-            
-            response = self.session.post(url, headers=headers, json=qradar_event)
-            return response.status_code == 201
+            response = await _post_with_retry(self.client, url, self._headers_json, body)
+            ok = response.status_code == 201
+            self.breaker.record(ok)
+            return ok
             
         except Exception as e:
+            self.breaker.record(False)
             logger.error(f"Error sending event to QRadar: {e}")
             return False
+
+    async def send_event(self, event: SIEMEvent) -> bool:
+        """Send event to QRadar"""
+        return await self.send_preformatted(self.format_event(event))
     
     async def query_events(self, query: str, time_range: Tuple[str, str]) -> List[SIEMEvent]:
         """Query events from QRadar"""
         try:
             url = f"{self.base_url}/api/events/search"
-            headers = {
-                'Authorization': f'Bearer {self.auth_token}',
-                'Content-Type': 'application/json'
-            }
-            
             data = {
                 'query': query,
                 'start_time': time_range[0],
                 'end_time': time_range[1]
             }
             
-            response = self.session.post(url, headers=headers, json=data)
+            response = await self.client.post(url, headers=self._headers_json, json=data)
             if response.status_code == 200:
-                events = []
-                for event_data in response.json().get('events', []):
-                    events.append(SIEMEvent(
-                        event_id=event_data.get('id', ''),
-                        timestamp=event_data.get('timestamp', ''),
-                        source=event_data.get('source', ''),
-                        event_type=event_data.get('event_type', ''),
-                        severity=event_data.get('severity', 'medium'),
-                        description=event_data.get('description', ''),
-                        raw_data=event_data,
-                        normalized_data=event_data
-                    ))
-                return events
+                return _events_from_rows(orjson.loads(response.content).get('events', []))
             else:
                 logger.error(f"Failed to query QRadar: {response.status_code}")
                 return []
@@ -314,7 +573,7 @@ class QRadarConnector(SIEMConnector):
                     'alert_id': 'alert_002',
                     'title': 'Suspicious network activity',
                     'severity': 'medium',
-                    'timestamp': datetime.utcnow().isoformat(),
+                    'timestamp': _now_iso(),
                     'source': 'qradar_network_monitor'
                 }
             ]
@@ -326,15 +585,17 @@ class AzureSentinelConnector(SIEMConnector):
     """Azure Sentinel SIEM connector"""
     
     def __init__(self):
-        self.session = None
+        self.client = None
         self.base_url = None
         self.auth_token = None
+        self._headers_json = None
+        self.breaker = CircuitBreaker()
     
     async def connect(self, config: IntegrationConfig) -> bool:
         """Connect to Azure Sentinel"""
         try:
             self.base_url = config.endpoint
-            self.session = requests.Session()
+            self.client = _get_shared_client()
             
             # Authenticate with Azure Sentinel
             auth_url = f"https://login.microsoftonline.com/{config.credentials['tenant_id']}/oauth2/v2.0/token"
@@ -345,9 +606,13 @@ class AzureSentinelConnector(SIEMConnector):
                 'grant_type': 'client_credentials'
             }
             
-            response = self.session.post(auth_url, data=auth_data)
+            response = await self.client.post(auth_url, data=auth_data)
             if response.status_code == 200:
-                self.auth_token = response.json().get('access_token')
+                self.auth_token = orjson.loads(response.content).get('access_token')
+                self._headers_json = {
+                    'Authorization': f'Bearer {self.auth_token}',
+                    'Content-Type': 'application/json'
+                }
                 logger.info("Successfully connected to Azure Sentinel")
                 return True
             else:
@@ -358,62 +623,50 @@ class AzureSentinelConnector(SIEMConnector):
             logger.error(f"Error connecting to Azure Sentinel: {e}")
             return False
     
-    async def send_event(self, event: SIEMEvent) -> bool:
-        """Send event to Azure Sentinel"""
+    def format_event(self, event: SIEMEvent) -> bytes:
+        """Serialize an event into the Azure Sentinel wire format"""
+        return orjson.dumps({
+            'timestamp': event.timestamp,
+            'source': event.source,
+            'event_type': event.event_type,
+            'severity': event.severity,
+            'description': event.description,
+            'raw_data': event.raw_data
+        })
+
+    async def send_preformatted(self, body: bytes) -> bool:
+        """Send an already serialized event body to Azure Sentinel"""
+        if not self.breaker.allow():
+            return False
         try:
             url = f"{self.base_url}/api/logs"
-            headers = {
-                'Authorization': f'Bearer {self.auth_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            # Format event for Azure Sentinel
-            sentinel_event = {
-                'timestamp': event.timestamp,
-                'source': event.source,
-                'event_type': event.event_type,
-                'severity': event.severity,
-                'description': event.description,
-                'raw_data': event.raw_data
-            }
-            
-            response = self.session.post(url, headers=headers, json=sentinel_event)
-            return response.status_code == 200
+            response = await _post_with_retry(self.client, url, self._headers_json, body)
+            ok = response.status_code == 200
+            self.breaker.record(ok)
+            return ok
             
         except Exception as e:
+            self.breaker.record(False)
             logger.error(f"Error sending event to Azure Sentinel: {e}")
             return False
+
+    async def send_event(self, event: SIEMEvent) -> bool:
+        """Send event to Azure Sentinel"""
+        return await self.send_preformatted(self.format_event(event))
     
     async def query_events(self, query: str, time_range: Tuple[str, str]) -> List[SIEMEvent]:
         """Query events from Azure Sentinel"""
         try:
             url = f"{self.base_url}/api/query"
-            headers = {
-                'Authorization': f'Bearer {self.auth_token}',
-                'Content-Type': 'application/json'
-            }
-            
             data = {
                 'query': query,
                 'start_time': time_range[0],
                 'end_time': time_range[1]
             }
             
-            response = self.session.post(url, headers=headers, json=data)
+            response = await self.client.post(url, headers=self._headers_json, json=data)
             if response.status_code == 200:
-                events = []
-                for event_data in response.json().get('events', []):
-                    events.append(SIEMEvent(
-                        event_id=event_data.get('id', ''),
-                        timestamp=event_data.get('timestamp', ''),
-                        source=event_data.get('source', ''),
-                        event_type=event_data.get('event_type', ''),
-                        severity=event_data.get('severity', 'medium'),
-                        description=event_data.get('description', ''),
-                        raw_data=event_data,
-                        normalized_data=event_data
-                    ))
-                return events
+                return _events_from_rows(orjson.loads(response.content).get('events', []))
             else:
                 logger.error(f"Failed to query Azure Sentinel: {response.status_code}")
                 return []
@@ -431,7 +684,7 @@ class AzureSentinelConnector(SIEMConnector):
                     'alert_id': 'alert_003',
                     'title': 'Azure security center alert',
                     'severity': 'high',
-                    'timestamp': datetime.utcnow().isoformat(),
+                    'timestamp': _now_iso(),
                     'source': 'azure_security_center'
                 }
             ]
@@ -461,25 +714,25 @@ class CortexXSOARConnector(SOARConnector):
     """Palo Alto Cortex XSOAR connector"""
     
     def __init__(self):
-        self.session = None
+        self.client = None
         self.base_url = None
         self.api_key = None
+        self._headers_json = None
     
     async def connect(self, config: IntegrationConfig) -> bool:
         """Connect to Cortex XSOAR"""
         try:
             self.base_url = config.endpoint
             self.api_key = config.credentials['api_key']
-            self.session = requests.Session()
-            
-            # Test connection
-            url = f"{self.base_url}/api/v2/system/info"
-            headers = {
+            self.client = _get_shared_client()
+            self._headers_json = {
                 'Authorization': f'Bearer {self.api_key}',
                 'Content-Type': 'application/json'
             }
             
-            response = self.session.get(url, headers=headers)
+            # Test connection
+            url = f"{self.base_url}/api/v2/system/info"
+            response = await self.client.get(url, headers=self._headers_json)
             if response.status_code == 200:
                 logger.info("Successfully connected to Cortex XSOAR")
                 return True
@@ -495,17 +748,12 @@ class CortexXSOARConnector(SOARConnector):
         """Execute SOAR playbook"""
         try:
             url = f"{self.base_url}/api/v2/playbook/execute"
-            headers = {
-                'Authorization': f'Bearer {self.api_key}',
-                'Content-Type': 'application/json'
-            }
-            
             data = {
                 'playbook_id': playbook.playbook_id,
                 'context': context
             }
             
-            response = self.session.post(url, headers=headers, json=data)
+            response = await self.client.post(url, headers=self._headers_json, json=data)
             return response.status_code == 200
             
         except Exception as e:
@@ -516,15 +764,10 @@ class CortexXSOARConnector(SOARConnector):
         """Get available playbooks"""
         try:
             url = f"{self.base_url}/api/v2/playbook/list"
-            headers = {
-                'Authorization': f'Bearer {self.api_key}',
-                'Content-Type': 'application/json'
-            }
-            
-            response = self.session.get(url, headers=headers)
+            response = await self.client.get(url, headers=self._headers_json)
             if response.status_code == 200:
                 playbooks = []
-                for pb_data in response.json().get('playbooks', []):
+                for pb_data in orjson.loads(response.content).get('playbooks', []):
                     playbooks.append(SOARPlaybook(
                         playbook_id=pb_data.get('id', ''),
                         name=pb_data.get('name', ''),
@@ -552,8 +795,33 @@ class SIEMSOARIntegrationHub:
         self.siem_connectors = {}
         self.soar_connectors = {}
         self.integration_configs = {}
+        # Active integrations partitioned by type and keyed by name so
+        # fan-out never rescans every registered config
+        self._active_siems = {}
+        self._active_soars = {}
         self.event_cache = {}
         self.cache_ttl = 3600  # 1 hour cache TTL
+        # playbook_id -> SOARPlaybook lookup per integration, TTL-cached
+        self._playbook_cache = {}
+        # Queue feeding the batched Splunk sender
+        self._event_queue = None
+        self._batch_task = None
+        self._batch_max_size = 500
+        self._batch_max_latency = 1.0
+        # Prebuilt report rows, one per config; the immutable fields are
+        # written once at registration and only status/last_sync refresh
+        self._detail_views: Dict[str, Dict[str, Any]] = {}
+        # Secondary indexes by type and status so "all siem"/"all active"
+        # lookups and the report summary are O(bucket) instead of O(N)
+        self.configs_by_type: Dict[str, Dict[str, IntegrationConfig]] = {'siem': {}, 'soar': {}}
+        self.configs_by_status: Dict[str, Dict[str, IntegrationConfig]] = defaultdict(dict)
+        # Report cache, reused until a config mutation bumps the version
+        self._config_version = 0
+        self._report_cache: Optional[Dict[str, Any]] = None
+        self._report_cache_version = -1
+        # Pre-encoded integration_details JSON fragment for the serve path
+        self._details_json_cache: Optional[bytes] = None
+        self._details_cache_version = -1
         
         # Initialize connectors
         self._initialize_connectors()
@@ -577,19 +845,37 @@ class SIEMSOARIntegrationHub:
     async def register_integration(self, config: IntegrationConfig) -> bool:
         """Register a new integration"""
         try:
+            # Compute dispatch keys once instead of per fan-out call
+            config.name_lower = config.name.lower()
+            config.connector_key = config.name_lower.replace(' ', '_')
+
+            previous = self.integration_configs.get(config.integration_id)
+            if previous is not None:
+                self._deindex_config(previous)
             self.integration_configs[config.integration_id] = config
+            self.configs_by_type.setdefault(config.type, {})[config.integration_id] = config
+            self.configs_by_status[config.status][config.integration_id] = config
+            self._detail_views[config.integration_id] = {
+                'integration_id': config.integration_id,
+                'name': config.name,
+                'type': config.type,
+                'status': config.status,
+                'last_sync': config.last_sync
+            }
+            self._mark_configs_dirty()
             
             # Connect to the system
             if config.type == 'siem':
-                connector = self.siem_connectors.get(config.name.lower().replace(' ', '_'))
+                connector = self.siem_connectors.get(config.connector_key)
                 if connector:
                     success = await connector.connect(config)
                     if success:
-                        config.status = 'active'
+                        self._set_status(config, 'active')
+                        self._index_active(config, connector)
                         logger.info(f"Successfully registered {config.name} integration")
                         return True
                     else:
-                        config.status = 'error'
+                        self._set_status(config, 'error')
                         logger.error(f"Failed to connect to {config.name}")
                         return False
                 else:
@@ -597,15 +883,16 @@ class SIEMSOARIntegrationHub:
                     return False
             
             elif config.type == 'soar':
-                connector = self.soar_connectors.get(config.name.lower().replace(' ', '_'))
+                connector = self.soar_connectors.get(config.connector_key)
                 if connector:
                     success = await connector.connect(config)
                     if success:
-                        config.status = 'active'
+                        self._set_status(config, 'active')
+                        self._index_active(config, connector)
                         logger.info(f"Successfully registered {config.name} integration")
                         return True
                     else:
-                        config.status = 'error'
+                        self._set_status(config, 'error')
                         logger.error(f"Failed to connect to {config.name}")
                         return False
                 else:
@@ -618,41 +905,149 @@ class SIEMSOARIntegrationHub:
             logger.error(f"Error registering integration: {e}")
             return False
     
+    def _mark_configs_dirty(self):
+        """Invalidate cached report state after a config mutation"""
+        self._config_version += 1
+        if cache_manager is not None:
+            try:
+                asyncio.get_running_loop().create_task(cache_manager.delete(_REPORT_CACHE_KEY))
+            except RuntimeError:
+                pass
+
+    def _set_status(self, config: IntegrationConfig, status: str):
+        """Update a config's status, keeping the secondary indexes in sync"""
+        self.configs_by_status[config.status].pop(config.integration_id, None)
+        config.status = status
+        self.configs_by_status[status][config.integration_id] = config
+        if status != 'active':
+            # A non-active integration must stop receiving fan-out traffic
+            self._deindex_active(config)
+        view = self._detail_views.get(config.integration_id)
+        if view is not None:
+            view['status'] = status
+            view['last_sync'] = config.last_sync
+        self._mark_configs_dirty()
+
+    def mark_synced(self, config: IntegrationConfig):
+        """Record a successful sync, keeping the report views in sync"""
+        config.last_sync = time.time_ns()
+        view = self._detail_views.get(config.integration_id)
+        if view is not None:
+            view['last_sync'] = config.last_sync
+        self._mark_configs_dirty()
+
+    def _deindex_config(self, config: IntegrationConfig):
+        """Remove a replaced config from the secondary indexes"""
+        self.configs_by_type.get(config.type, {}).pop(config.integration_id, None)
+        self.configs_by_status[config.status].pop(config.integration_id, None)
+        self._deindex_active(config)
+
+    def _deindex_active(self, config: IntegrationConfig):
+        """Drop a config's entry from the dispatch index, if present"""
+        index = self._active_siems if config.type == 'siem' else self._active_soars
+        entries = index.get(config.name_lower)
+        if not entries:
+            return
+        entries[:] = [e for e in entries if e[0] != config.integration_id]
+        if not entries:
+            index.pop(config.name_lower, None)
+
+    def _index_active(self, config: IntegrationConfig, connector: Any):
+        """Add a newly activated integration to the dispatch index"""
+        index = self._active_siems if config.type == 'siem' else self._active_soars
+        index.setdefault(config.name_lower, []).append(
+            (config.integration_id, config, connector)
+        )
+
+    def _matching_connectors(self, integration_type: str, name_filter: str) -> List[Tuple[str, IntegrationConfig, Any]]:
+        """Look up active connectors from the type-partitioned index"""
+        index = self._active_siems if integration_type == 'siem' else self._active_soars
+        name_filter = name_filter.lower()
+
+        if name_filter == 'all':
+            return [entry for entries in index.values() for entry in entries]
+
+        return list(index.get(name_filter, []))
+
+    async def _gather_results(self, integration_ids: List[str], coros: List[Any], default: Any) -> Dict[str, Any]:
+        """Run connector coroutines concurrently, keyed by integration id"""
+        outcomes = await asyncio.gather(*coros, return_exceptions=True)
+
+        results = {}
+        for integration_id, outcome in zip(integration_ids, outcomes):
+            if isinstance(outcome, Exception):
+                # One failing integration must not poison the batch
+                logger.error(f"Integration {integration_id} failed: {outcome}")
+                results[integration_id] = default
+            else:
+                results[integration_id] = outcome
+
+        return results
+
     async def send_event_to_siem(self, event: SIEMEvent, siem_type: str = 'all') -> Dict[str, bool]:
         """Send event to SIEM systems"""
         try:
-            results = {}
-            
-            for integration_id, config in self.integration_configs.items():
-                if config.type == 'siem' and config.status == 'active':
-                    if siem_type == 'all' or config.name.lower() == siem_type.lower():
-                        connector = self.siem_connectors.get(config.name.lower().replace(' ', '_'))
-                        if connector:
-                            success = await connector.send_event(event)
-                            results[integration_id] = success
-                            logger.info(f"Sent event to {config.name}: {success}")
-            
-            return results
+            # Fan out to all matching SIEMs concurrently - total latency is
+            # the slowest backend instead of the sum of all of them.
+            # Each wire format is serialized once and the same bytes are
+            # reused for every connector sharing that shape.
+            matches = self._matching_connectors('siem', siem_type)
+            bodies_by_shape = {}
+            integration_ids = []
+            coros = []
+            for integration_id, config, connector in matches:
+                body = bodies_by_shape.get(config.name_lower)
+                if body is None:
+                    body = connector.format_event(event)
+                    bodies_by_shape[config.name_lower] = body
+                integration_ids.append(integration_id)
+                coros.append(connector.send_preformatted(body))
+
+            return await self._gather_results(integration_ids, coros, False)
             
         except Exception as e:
             logger.error(f"Error sending event to SIEM: {e}")
             return {}
     
+    async def queue_event(self, event: SIEMEvent):
+        """Queue an event for batched delivery to Splunk backends"""
+        if self._event_queue is None:
+            self._event_queue = asyncio.Queue()
+
+        await self._event_queue.put(event)
+
+        if self._batch_task is None or self._batch_task.done():
+            self._batch_task = asyncio.create_task(self._drain_event_queue())
+
+    async def _drain_event_queue(self):
+        """Drain queued events into batched sends"""
+        while not self._event_queue.empty():
+            batch = [await self._event_queue.get()]
+            deadline = time.monotonic() + self._batch_max_latency
+
+            # Collect up to the batch cap or until the latency window closes
+            while len(batch) < self._batch_max_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._event_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            for integration_id, config, connector in self._matching_connectors('siem', 'splunk'):
+                success = await connector.send_events_batch(batch)
+                logger.info(f"Sent batch of {len(batch)} events to {config.name}: {success}")
+
     async def query_events_from_siem(self, query: str, time_range: Tuple[str, str], siem_type: str = 'all') -> Dict[str, List[SIEMEvent]]:
         """Query events from SIEM systems"""
         try:
-            results = {}
-            
-            for integration_id, config in self.integration_configs.items():
-                if config.type == 'siem' and config.status == 'active':
-                    if siem_type == 'all' or config.name.lower() == siem_type.lower():
-                        connector = self.siem_connectors.get(config.name.lower().replace(' ', '_'))
-                        if connector:
-                            events = await connector.query_events(query, time_range)
-                            results[integration_id] = events
-                            logger.info(f"Queried {len(events)} events from {config.name}")
-            
-            return results
+            matches = self._matching_connectors('siem', siem_type)
+            return await self._gather_results(
+                [integration_id for integration_id, _, _ in matches],
+                [connector.query_events(query, time_range) for _, _, connector in matches],
+                []
+            )
             
         except Exception as e:
             logger.error(f"Error querying events from SIEM: {e}")
@@ -661,18 +1056,12 @@ class SIEMSOARIntegrationHub:
     async def get_alerts_from_siem(self, filters: Dict[str, Any], siem_type: str = 'all') -> Dict[str, List[Dict[str, Any]]]:
         """Get alerts from SIEM systems"""
         try:
-            results = {}
-            
-            for integration_id, config in self.integration_configs.items():
-                if config.type == 'siem' and config.status == 'active':
-                    if siem_type == 'all' or config.name.lower() == siem_type.lower():
-                        connector = self.siem_connectors.get(config.name.lower().replace(' ', '_'))
-                        if connector:
-                            alerts = await connector.get_alerts(filters)
-                            results[integration_id] = alerts
-                            logger.info(f"Retrieved {len(alerts)} alerts from {config.name}")
-            
-            return results
+            matches = self._matching_connectors('siem', siem_type)
+            return await self._gather_results(
+                [integration_id for integration_id, _, _ in matches],
+                [connector.get_alerts(filters) for _, _, connector in matches],
+                []
+            )
             
         except Exception as e:
             logger.error(f"Error getting alerts from SIEM: {e}")
@@ -681,115 +1070,209 @@ class SIEMSOARIntegrationHub:
     async def execute_soar_playbook(self, playbook_id: str, context: Dict[str, Any], soar_type: str = 'all') -> Dict[str, bool]:
         """Execute SOAR playbook"""
         try:
-            results = {}
-            
-            for integration_id, config in self.integration_configs.items():
-                if config.type == 'soar' and config.status == 'active':
-                    if soar_type == 'all' or config.name.lower() == soar_type.lower():
-                        connector = self.soar_connectors.get(config.name.lower().replace(' ', '_'))
-                        if connector:
-                            # Get playbook
-                            playbooks = await connector.get_playbooks()
-                            playbook = next((pb for pb in playbooks if pb.playbook_id == playbook_id), None)
-                            
-                            if playbook:
-                                success = await connector.execute_playbook(playbook, context)
-                                results[integration_id] = success
-                                logger.info(f"Executed playbook {playbook_id} on {config.name}: {success}")
-                            else:
-                                logger.error(f"Playbook {playbook_id} not found on {config.name}")
-                                results[integration_id] = False
-            
-            return results
+            async def _execute(integration_id: str, config: IntegrationConfig, connector: Any) -> bool:
+                # Resolve the playbook from the cached index - repeated
+                # executions skip the per-call list round-trip
+                by_id = await self._get_playbook_index(integration_id, connector)
+                playbook = by_id.get(playbook_id)
+
+                if not playbook:
+                    logger.error(f"Playbook {playbook_id} not found on {config.name}")
+                    return False
+
+                success = await connector.execute_playbook(playbook, context)
+                logger.info(f"Executed playbook {playbook_id} on {config.name}: {success}")
+                return success
+
+            matches = self._matching_connectors('soar', soar_type)
+            return await self._gather_results(
+                [integration_id for integration_id, _, _ in matches],
+                [_execute(integration_id, config, connector) for integration_id, config, connector in matches],
+                False
+            )
             
         except Exception as e:
             logger.error(f"Error executing SOAR playbook: {e}")
             return {}
     
+    async def _get_playbook_index(self, integration_id: str, connector: Any) -> Dict[str, SOARPlaybook]:
+        """Get the playbook lookup table for an integration, cached with TTL"""
+        cached_at, by_id = self._playbook_cache.get(integration_id, (0.0, None))
+
+        if by_id is None or time.time() - cached_at > self.cache_ttl:
+            playbooks = await connector.get_playbooks()
+            by_id = {pb.playbook_id: pb for pb in playbooks}
+            self._playbook_cache[integration_id] = (time.time(), by_id)
+
+        return by_id
+
     async def get_soar_playbooks(self, soar_type: str = 'all') -> Dict[str, List[SOARPlaybook]]:
         """Get SOAR playbooks"""
         try:
-            results = {}
-            
-            for integration_id, config in self.integration_configs.items():
-                if config.type == 'soar' and config.status == 'active':
-                    if soar_type == 'all' or config.name.lower() == soar_type.lower():
-                        connector = self.soar_connectors.get(config.name.lower().replace(' ', '_'))
-                        if connector:
-                            playbooks = await connector.get_playbooks()
-                            results[integration_id] = playbooks
-                            logger.info(f"Retrieved {len(playbooks)} playbooks from {config.name}")
-            
-            return results
+            matches = self._matching_connectors('soar', soar_type)
+            return await self._gather_results(
+                [integration_id for integration_id, _, _ in matches],
+                [connector.get_playbooks() for _, _, connector in matches],
+                []
+            )
             
         except Exception as e:
             logger.error(f"Error getting SOAR playbooks: {e}")
             return {}
     
     async def correlate_events(self, events: List[SIEMEvent]) -> List[Dict[str, Any]]:
-        """Correlate events across SIEM systems"""
+        """Correlate events across SIEM systems
+
+        Takes ownership of the event list: the instances are recycled into
+        the event pool and the list is cleared, so callers must copy out
+        anything they still need before correlating.
+        """
         try:
-            correlations = []
-            
-            # Group events by correlation criteria
-            event_groups = {}
+            if not events:
+                return []
+
+            # Vectorized correlation: C-level groupby/agg instead of a
+            # Python dict-of-lists loop with per-event attribute access
+            records = [
+                {
+                    'id': event.event_id,
+                    'source': event.source,
+                    'event_type': event.event_type,
+                    'severity': event.severity,
+                    'timestamp': event.timestamp
+                }
+                for event in events
+            ]
+
+            # Aggregation only needs the plain records from here on;
+            # recycle the events and empty the caller's list so a stale
+            # reference fails loudly instead of aliasing a pooled object
             for event in events:
-                # Simple correlation by source and event type
-                key = f"{event.source}_{event.event_type}"
-                if key not in event_groups:
-                    event_groups[key] = []
-                event_groups[key].append(event)
-            
-            # Analyze correlations
-            for key, group_events in event_groups.items():
-                if len(group_events) > 1:
-                    correlation = {
-                        'correlation_id': f"corr_{int(time.time())}",
-                        'event_count': len(group_events),
-                        'source': group_events[0].source,
-                        'event_type': group_events[0].event_type,
-                        'severity': max(event.severity for event in group_events),
-                        'time_range': {
-                            'start': min(event.timestamp for event in group_events),
-                            'end': max(event.timestamp for event in group_events)
-                        },
-                        'events': [event.event_id for event in group_events],
-                        'correlation_score': len(group_events) * 0.2
-                    }
-                    correlations.append(correlation)
-            
-            return correlations
-            
+                release_event(event)
+            events.clear()
+
+            # Big batches run in a worker process so the event loop does
+            # not stall for the duration of the groupby
+            if len(records) >= _CORRELATE_OFFLOAD_THRESHOLD:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(_get_process_pool(), _correlate_sync, records)
+
+            return _correlate_sync(records)
+
         except Exception as e:
             logger.error(f"Error correlating events: {e}")
             return []
     
-    async def generate_integration_report(self) -> Dict[str, Any]:
-        """Generate integration status report"""
-        try:
-            report = {
-                'total_integrations': len(self.integration_configs),
-                'active_integrations': len([c for c in self.integration_configs.values() if c.status == 'active']),
-                'siem_integrations': len([c for c in self.integration_configs.values() if c.type == 'siem']),
-                'soar_integrations': len([c for c in self.integration_configs.values() if c.type == 'soar']),
-                'integration_details': []
-            }
-            
-            for integration_id, config in self.integration_configs.items():
-                report['integration_details'].append({
+    def generate_integration_report_sync(self, offset: int = 0, limit: Optional[int] = None) -> Dict[str, Any]:
+        """Generate integration status report without touching the event loop"""
+        # Pure in-memory dict/list construction: no try/except here, any
+        # failure is a bug the caller's API boundary should surface
+        # Configs change rarely but dashboards poll often, so reuse the
+        # assembled report until a registration invalidates it
+        if self._report_cache is not None and self._report_cache_version == self._config_version:
+            return self._report_page(self._report_cache, offset, limit)
+
+        # The summary reads running counters maintained at mutation
+        # sites; the detail rows are prebuilt views kept fresh at those
+        # same sites, so the loop only appends references
+        # Bind the hot names once so the loop runs on LOAD_FAST instead
+        # of repeated attribute chains
+        configs = self.integration_configs
+        views = self._detail_views
+        # One-shot allocation with indexed assignment avoids the amortized
+        # list-growth reallocations of repeated append
+        details = [None] * len(configs)
+        for i, (integration_id, config) in enumerate(configs.items()):
+            view = views.get(integration_id)
+            if view is None:
+                view = {
                     'integration_id': integration_id,
                     'name': config.name,
                     'type': config.type,
                     'status': config.status,
                     'last_sync': config.last_sync
-                })
-            
-            return report
-            
-        except Exception as e:
-            logger.error(f"Error generating integration report: {e}")
-            return {}
+                }
+                views[integration_id] = view
+            details[i] = view
+
+        report = {
+            'total_integrations': len(configs),
+            'active_integrations': len(self.configs_by_status.get('active', ())),
+            'siem_integrations': len(self.configs_by_type.get('siem', ())),
+            'soar_integrations': len(self.configs_by_type.get('soar', ())),
+            'integration_details': details
+        }
+
+        self._report_cache = report
+        self._report_cache_version = self._config_version
+        return self._report_page(report, offset, limit)
+
+    @staticmethod
+    def _report_page(report: Dict[str, Any], offset: int, limit: Optional[int]) -> Dict[str, Any]:
+        """Bound a report to one page of details; counts stay global"""
+        if offset == 0 and limit is None:
+            return copy.copy(report)
+        details = report['integration_details']
+        paged = copy.copy(report)
+        paged['integration_details'] = details[offset:offset + limit] if limit is not None else details[offset:]
+        return paged
+
+    async def generate_integration_report(self, offset: int = 0, limit: Optional[int] = None) -> Dict[str, Any]:
+        """Async shim kept for callers on the await path"""
+        return self.generate_integration_report_sync(offset, limit)
+
+    async def get_shared_report(self) -> Dict[str, Any]:
+        """Report via the shared cache so workers don't each recompute"""
+        # L1: the in-process cached dict
+        if self._report_cache is not None and self._report_cache_version == self._config_version:
+            return copy.copy(self._report_cache)
+
+        # L2: Redis, shared across uvicorn workers with a short TTL
+        if cache_manager is not None:
+            cached = await cache_manager.get(_REPORT_CACHE_KEY)
+            if cached is not None:
+                return cached
+
+        report = self.generate_integration_report_sync()
+        if cache_manager is not None:
+            await cache_manager.set(_REPORT_CACHE_KEY, report, ttl=30)
+        return report
+
+    def generate_integration_report_json(self) -> bytes:
+        """Serialize the report with orjson for HTTP consumers"""
+        return self.get_report_bytes()
+
+    def get_report_bytes(self) -> bytes:
+        """Serve the report as JSON bytes, reusing a cached details fragment"""
+        if self._details_json_cache is None or self._details_cache_version != self._config_version:
+            report = self.generate_integration_report_sync()
+            self._details_json_cache = orjson.dumps(report['integration_details'])
+            self._details_cache_version = self._report_cache_version
+        # Summary counts are O(1) reads, so serving is a single byte-format
+        # over the cached fragment instead of a full-dict encode
+        return (
+            b'{"total_integrations":%d,"active_integrations":%d,'
+            b'"siem_integrations":%d,"soar_integrations":%d,'
+            b'"integration_details":%s}' % (
+                len(self.integration_configs),
+                len(self.configs_by_status.get('active', ())),
+                len(self.configs_by_type.get('siem', ())),
+                len(self.configs_by_type.get('soar', ())),
+                self._details_json_cache,
+            )
+        )
+
+# Global SIEM/SOAR integration hub, constructed lazily so importing the
+# module stays cheap for consumers that never touch the hub
+_hub_singleton: Optional[SIEMSOARIntegrationHub] = None
+_hub_lock = threading.Lock()
 
-# Global SIEM/SOAR integration hub instance
-siem_soar_hub = SIEMSOARIntegrationHub()
+def get_hub() -> SIEMSOARIntegrationHub:
+    """Get or create the global SIEM/SOAR integration hub"""
+    global _hub_singleton
+    if _hub_singleton is None:
+        with _hub_lock:
+            if _hub_singleton is None:
+                _hub_singleton = SIEMSOARIntegrationHub()
+    return _hub_singleton
 
@@ -3,24 +3,31 @@ Automated Ticketing & Workflow - Intelligent ticket creation and routing
 """
 
 import asyncio
-import json
+import hashlib
+import sys
 import logging
-import requests
+import math
+import aiohttp
+import orjson
 import time
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
-import pandas as pd
+from functools import lru_cache
+from cachetools import LRUCache
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from abc import ABC, abstractmethod
 import re
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+# orjson parses large Jira/ServiceNow payloads ~3x faster than stdlib json
+_loads = orjson.loads
+
+@dataclass(slots=True)
 class Ticket:
     """Represents a ticket"""
     ticket_id: str
@@ -37,7 +44,7 @@ class Ticket:
     resolution: Optional[str] = None
     metadata: Dict[str, Any] = None
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowRule:
     """Represents a workflow rule"""
     rule_id: str
@@ -50,7 +57,7 @@ class WorkflowRule:
     last_triggered: Optional[str] = None
     trigger_count: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowAction:
     """Represents a workflow action"""
     action_id: str
@@ -59,7 +66,7 @@ class WorkflowAction:
     parameters: Dict[str, Any]
     conditions: List[Dict[str, Any]] = None
 
-@dataclass
+@dataclass(slots=True)
 class TicketTemplate:
     """Represents a ticket template"""
     template_id: str
@@ -103,31 +110,47 @@ class TicketingConnector(ABC):
 class JiraConnector(TicketingConnector):
     """Jira ticketing system connector"""
     
+    # Priority mappings shared by every call instead of per-call literals
+    _PRIORITY_TO_JIRA = {
+        'critical': 'Highest',
+        'high': 'High',
+        'medium': 'Medium',
+        'low': 'Low'
+    }
+    _JIRA_TO_PRIORITY = {v: k for k, v in _PRIORITY_TO_JIRA.items()}
+    
     def __init__(self):
         self.session = None
         self.base_url = None
         self.auth_token = None
+        self._url_issue = None
+        self._url_search = None
     
     async def connect(self, config: Dict[str, Any]) -> bool:
         """Connect to Jira"""
         try:
             self.base_url = config['endpoint']
             self.auth_token = config['api_token']
-            self.session = requests.Session()
+            # Async session with auth headers set once; concurrent ticket
+            # calls overlap on the event loop instead of blocking it
+            self.session = aiohttp.ClientSession(
+                headers={
+                    'Authorization': f'Basic {self.auth_token}',
+                    'Content-Type': 'application/json'
+                },
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
             
-            # Test connection
-            url = f"{self.base_url}/rest/api/2/myself"
-            headers = {
-                'Authorization': f'Basic {self.auth_token}',
-                'Content-Type': 'application/json'
-            }
+            # Endpoint URLs formatted once instead of per call
+            self._url_issue = f"{self.base_url}/rest/api/2/issue"
+            self._url_search = f"{self.base_url}/rest/api/2/search"
             
-            response = self.session.get(url, headers=headers)
-            if response.status_code == 200:
-                logger.info("Successfully connected to Jira")
-                return True
-            else:
-                logger.error(f"Failed to connect to Jira: {response.status_code}")
+            # Test connection
+            async with self.session.get(f"{self.base_url}/rest/api/2/myself") as response:
+                if response.status == 200:
+                    logger.info("Successfully connected to Jira")
+                    return True
+                logger.error(f"Failed to connect to Jira: {response.status}")
                 return False
                 
         except Exception as e:
@@ -137,19 +160,7 @@ class JiraConnector(TicketingConnector):
     async def create_ticket(self, ticket: Ticket) -> str:
         """Create ticket in Jira"""
         try:
-            url = f"{self.base_url}/rest/api/2/issue"
-            headers = {
-                'Authorization': f'Basic {self.auth_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            # Map priority to Jira priority
-            priority_map = {
-                'critical': 'Highest',
-                'high': 'High',
-                'medium': 'Medium',
-                'low': 'Low'
-            }
+            url = self._url_issue
             
             jira_ticket = {
                 'fields': {
@@ -157,19 +168,18 @@ class JiraConnector(TicketingConnector):
                     'issuetype': {'name': 'Task'},
                     'summary': ticket.title,
                     'description': ticket.description,
-                    'priority': {'name': priority_map.get(ticket.priority, 'Medium')},
+                    'priority': {'name': self._PRIORITY_TO_JIRA.get(ticket.priority, 'Medium')},
                     'labels': ticket.tags or [],
                     'assignee': {'name': ticket.assignee} if ticket.assignee else None
                 }
             }
             
-            response = self.session.post(url, headers=headers, json=jira_ticket)
-            if response.status_code == 201:
-                ticket_id = response.json().get('key')
-                logger.info(f"Created Jira ticket: {ticket_id}")
-                return ticket_id
-            else:
-                logger.error(f"Failed to create Jira ticket: {response.status_code}")
+            async with self.session.post(url, json=jira_ticket) as response:
+                if response.status == 201:
+                    ticket_id = _loads(await response.read()).get('key')
+                    logger.info(f"Created Jira ticket: {ticket_id}")
+                    return ticket_id
+                logger.error(f"Failed to create Jira ticket: {response.status}")
                 return None
                 
         except Exception as e:
@@ -179,11 +189,7 @@ class JiraConnector(TicketingConnector):
     async def update_ticket(self, ticket_id: str, updates: Dict[str, Any]) -> bool:
         """Update ticket in Jira"""
         try:
-            url = f"{self.base_url}/rest/api/2/issue/{ticket_id}"
-            headers = {
-                'Authorization': f'Basic {self.auth_token}',
-                'Content-Type': 'application/json'
-            }
+            url = self._url_issue + '/' + ticket_id
             
             # Map updates to Jira format
             jira_updates = {}
@@ -192,17 +198,11 @@ class JiraConnector(TicketingConnector):
             if 'assignee' in updates:
                 jira_updates['assignee'] = {'name': updates['assignee']}
             if 'priority' in updates:
-                priority_map = {
-                    'critical': 'Highest',
-                    'high': 'High',
-                    'medium': 'Medium',
-                    'low': 'Low'
-                }
-                jira_updates['priority'] = {'name': priority_map.get(updates['priority'], 'Medium')}
+                jira_updates['priority'] = {'name': self._PRIORITY_TO_JIRA.get(updates['priority'], 'Medium')}
             
             data = {'fields': jira_updates}
-            response = self.session.put(url, headers=headers, json=data)
-            return response.status_code == 204
+            async with self.session.put(url, json=data) as response:
+                return response.status == 204
             
         except Exception as e:
             logger.error(f"Error updating Jira ticket: {e}")
@@ -211,87 +211,91 @@ class JiraConnector(TicketingConnector):
     async def get_ticket(self, ticket_id: str) -> Optional[Ticket]:
         """Get ticket from Jira"""
         try:
-            url = f"{self.base_url}/rest/api/2/issue/{ticket_id}"
-            headers = {
-                'Authorization': f'Basic {self.auth_token}',
-                'Content-Type': 'application/json'
-            }
+            url = self._url_issue + '/' + ticket_id
             
-            response = self.session.get(url, headers=headers)
-            if response.status_code == 200:
-                data = response.json()
+            async with self.session.get(url) as response:
+                if response.status != 200:
+                    logger.error(f"Failed to get Jira ticket: {response.status}")
+                    return None
+                data = _loads(await response.read())
                 fields = data.get('fields', {})
                 
-                # Map Jira priority back to our format
-                priority_map = {
-                    'Highest': 'critical',
-                    'High': 'high',
-                    'Medium': 'medium',
-                    'Low': 'low'
-                }
-                
                 return Ticket(
                     ticket_id=ticket_id,
                     title=fields.get('summary', ''),
                     description=fields.get('description', ''),
-                    priority=priority_map.get(fields.get('priority', {}).get('name', ''), 'medium'),
+                    priority=self._JIRA_TO_PRIORITY.get(fields.get('priority', {}).get('name', ''), 'medium'),
                     status=fields.get('status', {}).get('name', 'open'),
                     assignee=fields.get('assignee', {}).get('displayName') if fields.get('assignee') else None,
                     created_at=fields.get('created', ''),
                     updated_at=fields.get('updated', ''),
                     tags=fields.get('labels', [])
                 )
-            else:
-                logger.error(f"Failed to get Jira ticket: {response.status_code}")
-                return None
                 
         except Exception as e:
             logger.error(f"Error getting Jira ticket: {e}")
             return None
     
+    # Filter keys that map straight to JQL fields; extending search
+    # support means adding an entry here, not another branch
+    _JQL_FIELDS = ('status', 'priority', 'assignee')
+    
+    @staticmethod
+    def _jql_clause(field: str, value: Any) -> str:
+        """Build a JQL clause, batching list values into a single IN"""
+        if isinstance(value, (list, tuple, set)):
+            quoted = ",".join("'{}'".format(str(v).replace("'", "\\'")) for v in value)
+            return f"{field} in ({quoted})"
+        escaped = str(value).replace("'", "\\'")
+        return f"{field} = '{escaped}'"
+    
     async def search_tickets(self, filters: Dict[str, Any]) -> List[Ticket]:
         """Search tickets in Jira"""
         try:
-            url = f"{self.base_url}/rest/api/2/search"
-            headers = {
-                'Authorization': f'Basic {self.auth_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            # Build JQL query
-            jql_parts = []
-            if 'status' in filters:
-                jql_parts.append(f"status = '{filters['status']}'")
-            if 'priority' in filters:
-                jql_parts.append(f"priority = '{filters['priority']}'")
-            if 'assignee' in filters:
-                jql_parts.append(f"assignee = '{filters['assignee']}'")
+            url = self._url_search
             
+            # Build JQL query; list-valued filters collapse to one IN
+            # clause instead of one request per value
+            jql_parts = [
+                self._jql_clause(field, filters[field])
+                for field in self._JQL_FIELDS
+                if field in filters
+            ]
             jql = " AND ".join(jql_parts) if jql_parts else "project = SEC"
             
-            data = {
-                'jql': jql,
-                'maxResults': filters.get('limit', 50)
-            }
+            limit = filters.get('limit', 50)
+            tickets = []
+            start_at = 0
             
-            response = self.session.post(url, headers=headers, json=data)
-            if response.status_code == 200:
-                tickets = []
-                for issue in response.json().get('issues', []):
+            # Page with startAt so large result sets arrive in
+            # ceil(total/maxResults) round-trips
+            while len(tickets) < limit:
+                data = {
+                    'jql': jql,
+                    'startAt': start_at,
+                    'maxResults': min(100, limit - len(tickets)),
+                    # Project only the fields Ticket uses; the default
+                    # payload is an order of magnitude larger
+                    'fields': ['summary', 'description', 'priority', 'status',
+                               'assignee', 'created', 'updated', 'labels'],
+                    'expand': ''
+                }
+                
+                async with self.session.post(url, json=data) as response:
+                    if response.status != 200:
+                        logger.error(f"Failed to search Jira tickets: {response.status}")
+                        return tickets
+                    payload = _loads(await response.read())
+                
+                issues = payload.get('issues', [])
+                for issue in issues:
                     fields = issue.get('fields', {})
                     
-                    priority_map = {
-                        'Highest': 'critical',
-                        'High': 'high',
-                        'Medium': 'medium',
-                        'Low': 'low'
-                    }
-                    
                     tickets.append(Ticket(
                         ticket_id=issue.get('key', ''),
                         title=fields.get('summary', ''),
                         description=fields.get('description', ''),
-                        priority=priority_map.get(fields.get('priority', {}).get('name', ''), 'medium'),
+                        priority=self._JIRA_TO_PRIORITY.get(fields.get('priority', {}).get('name', ''), 'medium'),
                         status=fields.get('status', {}).get('name', 'open'),
                         assignee=fields.get('assignee', {}).get('displayName') if fields.get('assignee') else None,
                         created_at=fields.get('created', ''),
@@ -299,14 +303,20 @@ class JiraConnector(TicketingConnector):
                         tags=fields.get('labels', [])
                     ))
                 
-                return tickets
-            else:
-                logger.error(f"Failed to search Jira tickets: {response.status_code}")
-                return []
+                start_at += len(issues)
+                if not issues or start_at >= payload.get('total', 0):
+                    break
+            
+            return tickets
                 
         except Exception as e:
             logger.error(f"Error searching Jira tickets: {e}")
             return []
+    
+    async def close(self):
+        """Close the underlying HTTP session"""
+        if self.session:
+            await self.session.close()
 
 class ServiceNowConnector(TicketingConnector):
     """ServiceNow ticketing system connector"""
@@ -315,27 +325,31 @@ class ServiceNowConnector(TicketingConnector):
         self.session = None
         self.base_url = None
         self.auth_token = None
+        self._url_incident = None
     
     async def connect(self, config: Dict[str, Any]) -> bool:
         """Connect to ServiceNow"""
         try:
             self.base_url = config['endpoint']
             self.auth_token = config['api_token']
-            self.session = requests.Session()
+            # Async session with auth headers set once
+            self.session = aiohttp.ClientSession(
+                headers={
+                    'Authorization': f'Bearer {self.auth_token}',
+                    'Content-Type': 'application/json'
+                },
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
             
-            # Test connection
-            url = f"{self.base_url}/api/now/table/sys_user"
-            headers = {
-                'Authorization': f'Bearer {self.auth_token}',
-                'Content-Type': 'application/json'
-            }
+            # Endpoint URL formatted once instead of per call
+            self._url_incident = f"{self.base_url}/api/now/table/incident"
             
-            response = self.session.get(url, headers=headers)
-            if response.status_code == 200:
-                logger.info("Successfully connected to ServiceNow")
-                return True
-            else:
-                logger.error(f"Failed to connect to ServiceNow: {response.status_code}")
+            # Test connection
+            async with self.session.get(f"{self.base_url}/api/now/table/sys_user") as response:
+                if response.status == 200:
+                    logger.info("Successfully connected to ServiceNow")
+                    return True
+                logger.error(f"Failed to connect to ServiceNow: {response.status}")
                 return False
                 
         except Exception as e:
@@ -345,11 +359,7 @@ class ServiceNowConnector(TicketingConnector):
     async def create_ticket(self, ticket: Ticket) -> str:
         """Create ticket in ServiceNow"""
         try:
-            url = f"{self.base_url}/api/now/table/incident"
-            headers = {
-                'Authorization': f'Bearer {self.auth_token}',
-                'Content-Type': 'application/json'
-            }
+            url = self._url_incident
             
             servicenow_ticket = {
                 'short_description': ticket.title,
@@ -360,13 +370,12 @@ class ServiceNowConnector(TicketingConnector):
                 'state': '1' if ticket.status == 'open' else '2'  # 1=New, 2=In Progress
             }
             
-            response = self.session.post(url, headers=headers, json=servicenow_ticket)
-            if response.status_code == 201:
-                ticket_id = response.json().get('result', {}).get('sys_id')
-                logger.info(f"Created ServiceNow ticket: {ticket_id}")
-                return ticket_id
-            else:
-                logger.error(f"Failed to create ServiceNow ticket: {response.status_code}")
+            async with self.session.post(url, json=servicenow_ticket) as response:
+                if response.status == 201:
+                    ticket_id = _loads(await response.read()).get('result', {}).get('sys_id')
+                    logger.info(f"Created ServiceNow ticket: {ticket_id}")
+                    return ticket_id
+                logger.error(f"Failed to create ServiceNow ticket: {response.status}")
                 return None
                 
         except Exception as e:
@@ -376,14 +385,10 @@ class ServiceNowConnector(TicketingConnector):
     async def update_ticket(self, ticket_id: str, updates: Dict[str, Any]) -> bool:
         """Update ticket in ServiceNow"""
         try:
-            url = f"{self.base_url}/api/now/table/incident/{ticket_id}"
-            headers = {
-                'Authorization': f'Bearer {self.auth_token}',
-                'Content-Type': 'application/json'
-            }
+            url = self._url_incident + '/' + ticket_id
             
-            response = self.session.put(url, headers=headers, json=updates)
-            return response.status_code == 200
+            async with self.session.put(url, json=updates) as response:
+                return response.status == 200
             
         except Exception as e:
             logger.error(f"Error updating ServiceNow ticket: {e}")
@@ -392,15 +397,13 @@ class ServiceNowConnector(TicketingConnector):
     async def get_ticket(self, ticket_id: str) -> Optional[Ticket]:
         """Get ticket from ServiceNow"""
         try:
-            url = f"{self.base_url}/api/now/table/incident/{ticket_id}"
-            headers = {
-                'Authorization': f'Bearer {self.auth_token}',
-                'Content-Type': 'application/json'
-            }
+            url = self._url_incident + '/' + ticket_id
             
-            response = self.session.get(url, headers=headers)
-            if response.status_code == 200:
-                data = response.json().get('result', {})
+            async with self.session.get(url) as response:
+                if response.status != 200:
+                    logger.error(f"Failed to get ServiceNow ticket: {response.status}")
+                    return None
+                data = _loads(await response.read()).get('result', {})
                 
                 return Ticket(
                     ticket_id=ticket_id,
@@ -412,9 +415,6 @@ class ServiceNowConnector(TicketingConnector):
                     created_at=data.get('sys_created_on', ''),
                     updated_at=data.get('sys_updated_on', '')
                 )
-            else:
-                logger.error(f"Failed to get ServiceNow ticket: {response.status_code}")
-                return None
                 
         except Exception as e:
             logger.error(f"Error getting ServiceNow ticket: {e}")
@@ -423,14 +423,13 @@ class ServiceNowConnector(TicketingConnector):
     async def search_tickets(self, filters: Dict[str, Any]) -> List[Ticket]:
         """Search tickets in ServiceNow"""
         try:
-            url = f"{self.base_url}/api/now/table/incident"
-            headers = {
-                'Authorization': f'Bearer {self.auth_token}',
-                'Content-Type': 'application/json'
-            }
+            url = self._url_incident
             
-            # Build query parameters
-            params = {}
+            # Build query parameters; project only the columns Ticket uses
+            params = {
+                'sysparm_fields': 'sys_id,short_description,description,priority,'
+                                  'state,assigned_to,sys_created_on,sys_updated_on'
+            }
             if 'status' in filters:
                 params['state'] = '1' if filters['status'] == 'open' else '2'
             if 'priority' in filters:
@@ -438,10 +437,12 @@ class ServiceNowConnector(TicketingConnector):
             if 'assignee' in filters:
                 params['assigned_to'] = filters['assignee']
             
-            response = self.session.get(url, headers=headers, params=params)
-            if response.status_code == 200:
+            async with self.session.get(url, params=params) as response:
+                if response.status != 200:
+                    logger.error(f"Failed to search ServiceNow tickets: {response.status}")
+                    return []
                 tickets = []
-                for data in response.json().get('result', []):
+                for data in _loads(await response.read()).get('result', []):
                     tickets.append(Ticket(
                         ticket_id=data.get('sys_id', ''),
                         title=data.get('short_description', ''),
@@ -454,22 +455,174 @@ class ServiceNowConnector(TicketingConnector):
                     ))
                 
                 return tickets
-            else:
-                logger.error(f"Failed to search ServiceNow tickets: {response.status_code}")
-                return []
                 
         except Exception as e:
             logger.error(f"Error searching ServiceNow tickets: {e}")
             return []
+    
+    async def close(self):
+        """Close the underlying HTTP session"""
+        if self.session:
+            await self.session.close()
+
+_iso_cache = (0.0, '')
+
+def _now_iso() -> str:
+    """Second-resolution ISO timestamp, cached between wall-clock ticks"""
+    global _iso_cache
+    t = time.time()
+    if t - _iso_cache[0] >= 1.0:
+        _iso_cache = (t, datetime.utcfromtimestamp(t).isoformat())
+    return _iso_cache[1]
+
+if sys.version_info >= (3, 11):
+    @lru_cache(maxsize=4096)
+    def _parse_iso(timestamp: str) -> datetime:
+        """Parse an ISO-8601 timestamp, memoized (ticket timestamps repeat heavily)"""
+        # 3.11+ fromisoformat is a C fast path that accepts the Z suffix
+        # directly, so the per-call .replace() allocation goes away
+        return datetime.fromisoformat(timestamp)
+else:
+    @lru_cache(maxsize=4096)
+    def _parse_iso(timestamp: str) -> datetime:
+        """Parse an ISO-8601 timestamp, memoized (ticket timestamps repeat heavily)"""
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+_now_cache = (0.0, datetime.utcnow())
+
+def _utcnow() -> datetime:
+    """Current UTC datetime, cached at one-second granularity"""
+    global _now_cache
+    t = time.time()
+    if t - _now_cache[0] >= 1.0:
+        _now_cache = (t, datetime.utcfromtimestamp(t))
+    return _now_cache[1]
+
+def _is_older_than(timestamp: str, days: int, now: Optional[datetime] = None) -> bool:
+    """Check if timestamp is older than specified days"""
+    try:
+        if not timestamp:
+            return False
+        
+        ticket_time = _parse_iso(timestamp)
+        cutoff_time = (now or _utcnow()) - timedelta(days=days)
+        
+        return ticket_time < cutoff_time
+        
+    except Exception as e:
+        logger.error(f"Error checking if older than: {e}")
+        return False
+
+def _is_past_due(due_date: str, now: Optional[datetime] = None) -> bool:
+    """Check if due date is past due"""
+    try:
+        if not due_date:
+            return False
+        
+        due_time = _parse_iso(due_date)
+        return due_time < (now or _utcnow())
+        
+    except Exception as e:
+        logger.error(f"Error checking if past due: {e}")
+        return False
+
+_LOWERED_FIELDS = ('title', 'description', 'category', 'priority', 'status')
+
+def _lowered_fields(ticket: Ticket) -> Dict[str, str]:
+    """Lowercase the string fields rules match on, once per ticket"""
+    return {
+        f: str(getattr(ticket, f, '') or '').lower()
+        for f in _LOWERED_FIELDS
+    }
+
+def _compile_condition(condition: Dict[str, Any]):
+    """Compile one condition dict into a ticket predicate"""
+    field = condition['field']
+    operator = condition['operator']
+    value = condition.get('value')
+    
+    if operator == 'equals':
+        return lambda t, low: getattr(t, field, '') == value
+    if operator == 'not_equals':
+        return lambda t, low: getattr(t, field, '') != value
+    if operator == 'contains':
+        # Rule values lower once at compile time; ticket fields lower
+        # once per ticket via the shared cache
+        needle = value.lower()
+        if field in _LOWERED_FIELDS:
+            return lambda t, low: needle in low[field]
+        return lambda t, low: needle in str(getattr(t, field, '')).lower()
+    if operator == 'greater_than':
+        return lambda t, low: isinstance(getattr(t, field, None), (int, float)) and getattr(t, field) > value
+    if operator == 'less_than':
+        return lambda t, low: isinstance(getattr(t, field, None), (int, float)) and getattr(t, field) < value
+    if operator == 'older_than':
+        # Values arrive as '7 days'; parse the count once at compile time
+        days = int(str(value).split()[0])
+        return lambda t, low: _is_older_than(getattr(t, field, ''), days)
+    if operator == 'past_due':
+        return lambda t, low: _is_past_due(getattr(t, field, ''))
+    return lambda t, low: True
+
+# Relative cost of each operator so compiled rules test cheap equality
+# checks before substring scans and datetime parsing
+_CONDITION_COST = {
+    'equals': 0,
+    'not_equals': 0,
+    'greater_than': 1,
+    'less_than': 1,
+    'contains': 2,
+    'past_due': 3,
+    'older_than': 3,
+}
+
+def _compile_conditions(conditions: List[Dict[str, Any]]):
+    """Fuse a rule's condition list into a single predicate"""
+    ordered = sorted(conditions, key=lambda c: _CONDITION_COST.get(c['operator'], 9))
+    predicates = [_compile_condition(c) for c in ordered]
+    if len(predicates) == 1:
+        return predicates[0]
+    
+    def predicate(ticket: Ticket, lowered: Dict[str, str]) -> bool:
+        for pred in predicates:
+            if not pred(ticket, lowered):
+                return False
+        return True
+    
+    return predicate
 
 class IntelligentTicketRouter:
     """Intelligent ticket routing and assignment system"""
     
     def __init__(self):
-        self.vectorizer = TfidfVectorizer(max_features=1000, stop_words='english')
         self.team_expertise = {}
         self.routing_rules = []
         self.ticket_templates = {}
+        self._team_names = []
+        # Hand-rolled tf-idf over the expertise corpus: four short
+        # documents don't justify sklearn's sparse pipeline, and the
+        # scipy/BLAS import cost disappears with it
+        self._idf = {}
+        self._team_vecs = []
+        self._team_norms = []
+        # SoA views of capacity/load so the routing penalty is one
+        # vectorized expression instead of per-team dict arithmetic
+        self._team_index = {}
+        self._capacities = None
+        self._loads = None
+        # Keyword-set fast path: frozensets and one compiled tokenizer
+        # resolve most tickets without touching the sparse pipeline
+        self._expertise_sets = {}
+        self._tok_re = re.compile(r"[A-Za-z]{3,}")
+        # Duplicate alerts fire the same ticket text repeatedly; a
+        # content-addressed cache skips re-scoring them. Cleared once
+        # team loads drift enough to change the ranking.
+        self._route_cache = LRUCache(maxsize=4096)
+        self._load_drift = 0
+        # Combined scan for contains rules: one pass over the description
+        # classifies against every keyword
+        self._contains_index = {}
+        self._contains_re = None
         
         # Initialize routing system
         self._initialize_routing_system()
@@ -501,6 +654,32 @@ class IntelligentTicketRouter:
                 }
             }
             
+            # Build idf weights and per-team tf-idf vectors once; routing
+            # scores tickets with plain dict arithmetic
+            self._team_names = list(self.team_expertise.keys())
+            docs = [[w.lower() for w in info['expertise']] for info in self.team_expertise.values()]
+            df = Counter()
+            for doc in docs:
+                df.update(set(doc))
+            n_docs = len(docs)
+            self._idf = {t: math.log((n_docs + 1) / (count + 1)) + 1 for t, count in df.items()}
+            self._team_vecs = []
+            self._team_norms = []
+            for doc in docs:
+                tf = Counter(doc)
+                vec = {t: c * self._idf[t] for t, c in tf.items()}
+                self._team_vecs.append(vec)
+                self._team_norms.append(math.sqrt(sum(w * w for w in vec.values())) or 1.0)
+            self._team_index = {team: i for i, team in enumerate(self._team_names)}
+            self._capacities = np.array(
+                [info['capacity'] for info in self.team_expertise.values()], dtype=np.float32
+            )
+            self._loads = np.zeros_like(self._capacities)
+            self._expertise_sets = {
+                team: frozenset(w.lower() for w in info['expertise'])
+                for team, info in self.team_expertise.items()
+            }
+            
             # Define routing rules
             self.routing_rules = [
                 {
@@ -534,6 +713,42 @@ class IntelligentTicketRouter:
                 }
             ]
             
+            # Compile each rule's conditions once; the hot path is one
+            # predicate call per rule. Only rules whose contains conditions
+            # all target the description may be gated by the keyword scan,
+            # since that is the only field the scan reads.
+            for idx, rule in enumerate(self.routing_rules):
+                rule['_predicate'] = _compile_conditions(rule['conditions'])
+                contains_fields = [
+                    cond['field'] for cond in rule['conditions']
+                    if cond['operator'] == 'contains'
+                ]
+                rule['_desc_gated'] = bool(contains_fields) and all(
+                    f == 'description' for f in contains_fields
+                )
+                if rule['_desc_gated']:
+                    for cond in rule['conditions']:
+                        if cond['operator'] == 'contains':
+                            kw = cond['value'].lower()
+                            self._contains_index.setdefault(kw, set()).add(idx)
+            # When one keyword contains another ("security incident" /
+            # "incident"), a hit on the longer one must also activate the
+            # shorter one's rules: the scan reports the longest alternative
+            # per position, so fold substring keywords' rule sets upward
+            for kw_a, idxs_a in self._contains_index.items():
+                for kw_b, idxs_b in self._contains_index.items():
+                    if kw_a != kw_b and kw_a in kw_b:
+                        idxs_b |= idxs_a
+            # One compiled alternation scans the description against every
+            # contains keyword in a single pass; the lookahead keeps
+            # matches zero-width so overlapping occurrences are not
+            # swallowed by non-overlapping findall semantics
+            if self._contains_index:
+                alternation = '|'.join(
+                    sorted((re.escape(kw) for kw in self._contains_index), key=len, reverse=True)
+                )
+                self._contains_re = re.compile(f'(?=({alternation}))')
+            
             logger.info("Intelligent ticket routing system initialized")
             
         except Exception as e:
@@ -542,10 +757,21 @@ class IntelligentTicketRouter:
     async def route_ticket(self, ticket: Ticket) -> str:
         """Route ticket to appropriate team"""
         try:
-            # Check routing rules
-            for rule in self.routing_rules:
-                if await self._evaluate_rule_conditions(rule['conditions'], ticket):
-                    return await self._execute_rule_actions(rule['actions'], ticket)
+            # Check routing rules via their compiled predicates, sharing
+            # one lowered view of the ticket's string fields. Rules gated
+            # on contains keywords are skipped unless the single keyword
+            # scan saw their keyword.
+            lowered = _lowered_fields(ticket)
+            matched = None
+            if self._contains_re is not None:
+                matched = set()
+                for kw in self._contains_re.findall(lowered['description']):
+                    matched |= self._contains_index[kw]
+            for idx, rule in enumerate(self.routing_rules):
+                if rule['_desc_gated'] and matched is not None and idx not in matched:
+                    continue
+                if rule['_predicate'](ticket, lowered):
+                    return self._execute_rule_actions(rule['actions'], ticket)
             
             # Use ML-based routing as fallback
             return await self._ml_based_routing(ticket)
@@ -554,36 +780,7 @@ class IntelligentTicketRouter:
             logger.error(f"Error routing ticket: {e}")
             return 'security_team'  # Default fallback
     
-    async def _evaluate_rule_conditions(self, conditions: List[Dict[str, Any]], ticket: Ticket) -> bool:
-        """Evaluate rule conditions"""
-        try:
-            for condition in conditions:
-                field = condition['field']
-                operator = condition['operator']
-                value = condition['value']
-                
-                ticket_value = getattr(ticket, field, '')
-                
-                if operator == 'equals':
-                    if ticket_value != value:
-                        return False
-                elif operator == 'contains':
-                    if value.lower() not in str(ticket_value).lower():
-                        return False
-                elif operator == 'greater_than':
-                    if not (isinstance(ticket_value, (int, float)) and ticket_value > value):
-                        return False
-                elif operator == 'less_than':
-                    if not (isinstance(ticket_value, (int, float)) and ticket_value < value):
-                        return False
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error evaluating rule conditions: {e}")
-            return False
-    
-    async def _execute_rule_actions(self, actions: List[Dict[str, Any]], ticket: Ticket) -> str:
+    def _execute_rule_actions(self, actions: List[Dict[str, Any]], ticket: Ticket) -> str:
         """Execute rule actions"""
         try:
             for action in actions:
@@ -599,49 +796,109 @@ class IntelligentTicketRouter:
             logger.error(f"Error executing rule actions: {e}")
             return 'security_team'
     
-    async def _ml_based_routing(self, ticket: Ticket) -> str:
-        """ML-based ticket routing"""
+    async def route_tickets(self, tickets: List[Ticket]) -> List[str]:
+        """Route a batch of tickets, amortizing the ML path over the batch"""
         try:
-            # Prepare text for analysis
-            text = f"{ticket.title} {ticket.description}"
+            results: List[Optional[str]] = [None] * len(tickets)
+            pending = []
             
-            # Calculate similarity with team expertise
-            similarities = {}
-            for team, info in self.team_expertise.items():
-                expertise_text = ' '.join(info['expertise'])
-                similarity = self._calculate_text_similarity(text, expertise_text)
-                similarities[team] = similarity
+            # Rules still apply per ticket; only unresolved tickets fall
+            # through to the vectorized ML pass
+            for i, ticket in enumerate(tickets):
+                lowered = _lowered_fields(ticket)
+                for rule in self.routing_rules:
+                    if rule['_predicate'](ticket, lowered):
+                        results[i] = self._execute_rule_actions(rule['actions'], ticket)
+                        break
+                if results[i] is None:
+                    pending.append(i)
             
-            # Consider team capacity
-            for team in similarities:
-                capacity_ratio = self.team_expertise[team]['current_load'] / self.team_expertise[team]['capacity']
-                similarities[team] *= (1 - capacity_ratio)  # Reduce score for overloaded teams
+            if pending:
+                penalty = 1.0 - self._loads / self._capacities
+                for i in pending:
+                    t = tickets[i]
+                    sims = self._expertise_scores(f"{t.title} {t.description}")
+                    if sims is None:
+                        results[i] = 'security_team'
+                    else:
+                        results[i] = self._team_names[int(np.argmax(sims * penalty))]
             
-            # Return team with highest similarity
-            best_team = max(similarities, key=similarities.get)
-            return best_team
+            return results
             
         except Exception as e:
-            logger.error(f"Error in ML-based routing: {e}")
-            return 'security_team'
+            logger.error(f"Error routing ticket batch: {e}")
+            return ['security_team'] * len(tickets)
     
-    def _calculate_text_similarity(self, text1: str, text2: str) -> float:
-        """Calculate text similarity using TF-IDF and cosine similarity"""
+    def _expertise_scores(self, text: str) -> Optional[np.ndarray]:
+        """Cosine scores of a ticket text against each team's tf-idf vector"""
+        tokens = self._tok_re.findall(text.lower())
+        if not tokens:
+            return None
+        
+        q_tf = Counter(tokens)
+        idf = self._idf
+        query = {t: c * idf[t] for t, c in q_tf.items() if t in idf}
+        if not query:
+            return None
+        q_norm = math.sqrt(sum(w * w for w in query.values()))
+        
+        scores = np.empty(len(self._team_vecs), dtype=np.float32)
+        for i, (vec, norm) in enumerate(zip(self._team_vecs, self._team_norms)):
+            dot = sum(w * vec[t] for t, w in query.items() if t in vec)
+            scores[i] = dot / (q_norm * norm)
+        return scores
+    
+    async def _ml_based_routing(self, ticket: Ticket) -> str:
+        """ML-based ticket routing"""
         try:
-            # Combine texts
-            texts = [text1, text2]
+            # Transform the ticket text against the pre-fitted expertise
+            # matrix - one sparse transform and one similarity call
+            text = f"{ticket.title} {ticket.description}"
+            
+            key = hashlib.blake2b(
+                f"{ticket.title}\x00{ticket.description}\x00{ticket.priority}".encode(),
+                digest_size=16
+            ).digest()
+            cached = self._route_cache.get(key)
+            if cached is not None:
+                return cached
             
-            # Fit and transform
-            tfidf_matrix = self.vectorizer.fit_transform(texts)
+            # Jaccard over precompiled keyword sets first: a handful of
+            # hash lookups per team beats the sparse matmul whenever any
+            # expertise keyword appears in the ticket
+            tokens = frozenset(self._tok_re.findall(text.lower()))
+            if tokens:
+                best_team = None
+                best_score = 0.0
+                for team, expertise in self._expertise_sets.items():
+                    overlap = len(tokens & expertise)
+                    if overlap:
+                        score = overlap / len(tokens | expertise)
+                        info = self.team_expertise[team]
+                        score *= (1 - info['current_load'] / info['capacity'])
+                        if score > best_score:
+                            best_score = score
+                            best_team = team
+                if best_team is not None:
+                    self._route_cache[key] = best_team
+                    return best_team
             
-            # Calculate cosine similarity
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+            # Fall back to tf-idf scoring when no expertise keyword matched
+            similarities = self._expertise_scores(text)
+            if similarities is None:
+                return 'security_team'
             
-            return similarity
+            # Consider team capacity in one vectorized expression
+            scores = similarities * (1.0 - self._loads / self._capacities)
+            
+            # Return team with highest score
+            team = self._team_names[int(np.argmax(scores))]
+            self._route_cache[key] = team
+            return team
             
         except Exception as e:
-            logger.error(f"Error calculating text similarity: {e}")
-            return 0.0
+            logger.error(f"Error in ML-based routing: {e}")
+            return 'security_team'
     
     async def create_ticket_from_template(self, template_id: str, context: Dict[str, Any]) -> Ticket:
         """Create ticket from template"""
@@ -663,7 +920,7 @@ class IntelligentTicketRouter:
                 assignee=template.default_assignee,
                 category=template.category,
                 tags=template.tags or [],
-                created_at=datetime.utcnow().isoformat()
+                created_at=_now_iso()
             )
             
             return ticket
@@ -676,8 +933,15 @@ class IntelligentTicketRouter:
         """Update team load"""
         try:
             if team in self.team_expertise:
-                self.team_expertise[team]['current_load'] += change
-                self.team_expertise[team]['current_load'] = max(0, self.team_expertise[team]['current_load'])
+                info = self.team_expertise[team]
+                info['current_load'] = max(0, info['current_load'] + change)
+                self._loads[self._team_index[team]] = info['current_load']
+                # Cached routes embed the capacity penalty, so drop them
+                # once loads have drifted enough to change the ranking
+                self._load_drift += abs(change)
+                if self._load_drift >= 5:
+                    self._route_cache.clear()
+                    self._load_drift = 0
                 
         except Exception as e:
             logger.error(f"Error updating team load: {e}")
@@ -689,6 +953,25 @@ class AutomatedWorkflowEngine:
         self.workflow_rules = []
         self.active_workflows = {}
         self.ticketing_connectors = {}
+        self._compiled_rules = []
+        self._time_specs = ()
+        
+        # Channel name -> coroutine; notification fan-out dispatches through
+        # this table and runs the channels concurrently
+        self._dispatchers = {
+            'email': self._send_email,
+            'slack': self._send_slack,
+            'teams': self._send_teams,
+        }
+        
+        # Action type -> coroutine; O(1) dispatch instead of an if/elif
+        # chain re-run for every action of every triggered rule
+        self._action_handlers = {
+            'assign': self._action_assign,
+            'update_status': self._action_update_status,
+            'notify': self._action_notify,
+            'escalate': self._action_escalate,
+        }
         
         # Initialize workflow engine
         self._initialize_workflow_engine()
@@ -742,6 +1025,36 @@ class AutomatedWorkflowEngine:
                 }
             ]
             
+            # Compile conditions and pre-sort by priority once instead of
+            # sorting and re-interpreting the dicts per ticket
+            for rule in self.workflow_rules:
+                rule.setdefault('trigger_count', 0)
+            self._compiled_rules = [
+                (rule, _compile_conditions(rule['conditions']))
+                for rule in sorted(self.workflow_rules, key=lambda r: r['priority'])
+            ]
+            
+            # Batch path: split each rule into its time-based conditions,
+            # which NumPy can evaluate over the whole batch at once, and a
+            # fused scalar predicate for everything else
+            time_specs = set()
+            for rule, _ in self._compiled_rules:
+                specs = []
+                scalar_conditions = []
+                for cond in rule['conditions']:
+                    if cond['operator'] == 'past_due':
+                        specs.append((cond['field'], 0))
+                    elif cond['operator'] == 'older_than':
+                        specs.append((cond['field'], int(str(cond['value']).split()[0])))
+                    else:
+                        scalar_conditions.append(cond)
+                rule['_time_specs'] = specs
+                rule['_scalar_predicate'] = (
+                    _compile_conditions(scalar_conditions) if scalar_conditions else None
+                )
+                time_specs.update(specs)
+            self._time_specs = tuple(time_specs)
+            
             logger.info("Automated workflow engine initialized")
             
         except Exception as e:
@@ -750,16 +1063,14 @@ class AutomatedWorkflowEngine:
     async def process_ticket(self, ticket: Ticket) -> bool:
         """Process ticket through workflow rules"""
         try:
-            # Sort rules by priority
-            sorted_rules = sorted(self.workflow_rules, key=lambda x: x['priority'])
-            
-            for rule in sorted_rules:
+            lowered = _lowered_fields(ticket)
+            for rule, predicate in self._compiled_rules:
                 if not rule['enabled']:
                     continue
                 
-                if await self._evaluate_workflow_conditions(rule['conditions'], ticket):
+                if predicate(ticket, lowered):
                     await self._execute_workflow_actions(rule['actions'], ticket)
-                    rule['last_triggered'] = datetime.utcnow().isoformat()
+                    rule['last_triggered'] = _now_iso()
                     rule['trigger_count'] += 1
             
             return True
@@ -768,101 +1079,127 @@ class AutomatedWorkflowEngine:
             logger.error(f"Error processing ticket: {e}")
             return False
     
-    async def _evaluate_workflow_conditions(self, conditions: List[Dict[str, Any]], ticket: Ticket) -> bool:
-        """Evaluate workflow conditions"""
+    def _batch_evaluate(self, tickets: List[Ticket]) -> Dict[tuple, np.ndarray]:
+        """Evaluate the rules' time-based conditions over a whole batch at once"""
+        masks = {}
+        if not tickets or not self._time_specs:
+            return masks
+        
+        now = np.datetime64(_utcnow(), 's')
+        arrays = {}
+        for field, days in self._time_specs:
+            arr = arrays.get(field)
+            if arr is None:
+                # Truncate to seconds; drops Z/offset suffixes and keeps
+                # NumPy's parser on the fast naive-datetime path
+                values = [
+                    (str(getattr(t, field, '') or '')[:19] or 'NaT')
+                    for t in tickets
+                ]
+                arr = np.array(values, dtype='datetime64[s]')
+                arrays[field] = arr
+            # NaT (missing timestamp) compares False, matching the scalar
+            # helpers' early-return for empty values
+            masks[(field, days)] = arr < (now - np.timedelta64(days, 'D'))
+        return masks
+    
+    async def process_tickets(self, tickets: List[Ticket]) -> int:
+        """Process a batch of tickets; returns the number of rule triggers"""
         try:
-            for condition in conditions:
-                field = condition['field']
-                operator = condition['operator']
-                value = condition['value']
+            masks = self._batch_evaluate(tickets)
+            lowered_all = [_lowered_fields(t) for t in tickets]
+            triggered = 0
+            
+            for rule, _ in self._compiled_rules:
+                if not rule['enabled']:
+                    continue
                 
-                ticket_value = getattr(ticket, field, '')
+                specs = rule['_time_specs']
+                if specs:
+                    combined = masks[specs[0]]
+                    for spec in specs[1:]:
+                        combined = combined & masks[spec]
+                    candidates = np.nonzero(combined)[0]
+                else:
+                    candidates = range(len(tickets))
                 
-                if operator == 'equals':
-                    if ticket_value != value:
-                        return False
-                elif operator == 'not_equals':
-                    if ticket_value == value:
-                        return False
-                elif operator == 'contains':
-                    if value.lower() not in str(ticket_value).lower():
-                        return False
-                elif operator == 'older_than':
-                    if not self._is_older_than(ticket_value, value):
-                        return False
-                elif operator == 'past_due':
-                    if not self._is_past_due(ticket_value):
-                        return False
+                scalar = rule['_scalar_predicate']
+                for i in candidates:
+                    ticket = tickets[i]
+                    if scalar is not None and not scalar(ticket, lowered_all[i]):
+                        continue
+                    await self._execute_workflow_actions(rule['actions'], ticket)
+                    rule['last_triggered'] = _now_iso()
+                    rule['trigger_count'] += 1
+                    triggered += 1
             
-            return True
+            return triggered
             
         except Exception as e:
-            logger.error(f"Error evaluating workflow conditions: {e}")
-            return False
+            logger.error(f"Error processing ticket batch: {e}")
+            return 0
     
     async def _execute_workflow_actions(self, actions: List[Dict[str, Any]], ticket: Ticket):
         """Execute workflow actions"""
         try:
+            handlers = self._action_handlers
             for action in actions:
-                if action['type'] == 'assign':
-                    ticket.assignee = action['target']
-                elif action['type'] == 'update_status':
-                    ticket.status = action['status']
-                elif action['type'] == 'notify':
-                    await self._send_notification(action['channels'], ticket)
-                elif action['type'] == 'escalate':
-                    await self._escalate_ticket(action['level'], ticket)
+                handler = handlers.get(action['type'])
+                if handler is not None:
+                    await handler(action, ticket)
             
         except Exception as e:
             logger.error(f"Error executing workflow actions: {e}")
     
-    def _is_older_than(self, timestamp: str, days: str) -> bool:
-        """Check if timestamp is older than specified days"""
-        try:
-            if not timestamp:
-                return False
-            
-            ticket_time = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-            cutoff_time = datetime.utcnow() - timedelta(days=int(days.split()[0]))
-            
-            return ticket_time < cutoff_time
-            
-        except Exception as e:
-            logger.error(f"Error checking if older than: {e}")
-            return False
+    async def _action_assign(self, action: Dict[str, Any], ticket: Ticket):
+        """Assign the ticket to the action's target"""
+        ticket.assignee = action['target']
     
-    def _is_past_due(self, due_date: str) -> bool:
-        """Check if due date is past due"""
-        try:
-            if not due_date:
-                return False
-            
-            due_time = datetime.fromisoformat(due_date.replace('Z', '+00:00'))
-            return due_time < datetime.utcnow()
-            
-        except Exception as e:
-            logger.error(f"Error checking if past due: {e}")
-            return False
+    async def _action_update_status(self, action: Dict[str, Any], ticket: Ticket):
+        """Move the ticket to the action's status"""
+        ticket.status = action['status']
+    
+    async def _action_notify(self, action: Dict[str, Any], ticket: Ticket):
+        """Notify the action's channels about the ticket"""
+        await self._send_notification(action['channels'], ticket)
+    
+    async def _action_escalate(self, action: Dict[str, Any], ticket: Ticket):
+        """Escalate the ticket to the action's level"""
+        await self._escalate_ticket(action['level'], ticket)
     
     async def _send_notification(self, channels: List[str], ticket: Ticket):
-        """Send notification through specified channels"""
+        """Send notification through specified channels concurrently"""
         try:
             message = f"Ticket {ticket.ticket_id}: {ticket.title} - Status: {ticket.status}"
             
-            for channel in channels:
-                if channel == 'email':
-                    # Send email notification
-                    logger.info(f"Email notification: {message}")
-                elif channel == 'slack':
-                    # Send Slack notification
-                    logger.info(f"Slack notification: {message}")
-                elif channel == 'teams':
-                    # Send Teams notification
-                    logger.info(f"Teams notification: {message}")
+            known = [c for c in channels if c in self._dispatchers]
+            if not known:
+                return
+            
+            # One slow or failing channel must not delay or drop the others
+            results = await asyncio.gather(
+                *(self._dispatchers[c](message) for c in known),
+                return_exceptions=True,
+            )
+            for channel, result in zip(known, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Notification via {channel} failed: {result}")
             
         except Exception as e:
             logger.error(f"Error sending notification: {e}")
     
+    async def _send_email(self, message: str):
+        """Send email notification"""
+        logger.info(f"Email notification: {message}")
+    
+    async def _send_slack(self, message: str):
+        """Send Slack notification"""
+        logger.info(f"Slack notification: {message}")
+    
+    async def _send_teams(self, message: str):
+        """Send Teams notification"""
+        logger.info(f"Teams notification: {message}")
+    
     async def _escalate_ticket(self, level: str, ticket: Ticket):
         """Escalate ticket to specified level"""
         try:
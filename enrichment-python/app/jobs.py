@@ -5,16 +5,45 @@ Uses Valkey (Redis-compatible) for job queue storage
 """
 
 import asyncio
+import hashlib
 import logging
-from typing import Dict, Any, Optional
+import os
+
+import orjson
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 from arq import create_pool
 from arq.connections import RedisSettings
+from arq.constants import result_key_prefix
+from arq.jobs import deserialize_result
 from arq.worker import Worker
 from .core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Stream used as a push-style wakeup channel for ready-now jobs. The ARQ
+# sorted set stays authoritative (delayed jobs, crash recovery); stream
+# entries only tell a blocked worker that something is claimable.
+_STREAM_KEY = "arq:stream"
+_STREAM_GROUP = "arq"
+_STREAM_MAXLEN = 10000
+
+def _job_serializer(obj) -> bytes:
+    """Serialize job payloads/results as JSON instead of pickle"""
+    # default=str covers the odd non-JSON value (e.g. an exception arq
+    # stores for a crashed job) without failing the whole result write
+    return orjson.dumps(obj, default=str)
+
+
+def _job_deserializer(data: bytes):
+    """Inverse of _job_serializer"""
+    return orjson.loads(data)
+
+
+# Completed jobs never change status, so their decoded results are pinned
+# in-process and served without touching Redis again
+_STATUS_CACHE_MAX = 10000
+
 
 class JobQueue:
     """
@@ -26,16 +55,32 @@ class JobQueue:
     def __init__(self):
         self.redis_pool = None
         self.worker: Optional[Worker] = None
+        self._status_cache: Dict[str, Dict[str, Any]] = {}
+        self._init_lock = asyncio.Lock()
         
     async def initialize(self):
         """Initialize ARQ connection pool"""
+        # Double-checked lock: a cold-start burst of requests must not race
+        # this and open one connection pool each
+        async with self._init_lock:
+            if self.redis_pool:
+                return
+            await self._initialize_pool()
+    
+    async def _initialize_pool(self):
         try:
             redis_url = settings.get_redis_dsn() if hasattr(settings, 'get_redis_dsn') else f"redis://{settings.redis_host}:{settings.redis_port}/{settings.redis_db}"
             
             # Parse Redis URL for ARQ
             redis_settings = RedisSettings.from_dsn(redis_url)
+            redis_settings.conn_timeout = 5
+            redis_settings.max_connections = 32
             
-            self.redis_pool = await create_pool(redis_settings)
+            self.redis_pool = await create_pool(
+                redis_settings,
+                job_serializer=_job_serializer,
+                job_deserializer=_job_deserializer,
+            )
             logger.info("ARQ job queue initialized")
             
         except Exception as e:
@@ -55,42 +100,127 @@ class JobQueue:
         
         Args:
             job_name: Name of the job function
-            job_data: Job payload data
-            job_id: Optional job ID
+            job_data: Job payload, passed as the function's single positional
+                argument (all registered jobs take (ctx, payload))
+            job_id: Optional job ID; derived from the payload content when
+                omitted, so re-submitting identical work dedupes in Redis
             delay: Optional delay in seconds
             max_retries: Maximum retry attempts
         """
         if not self.redis_pool:
             await self.initialize()
         
+        if job_id is None:
+            job_id = self._content_job_id(job_name, job_data)
+        
         try:
             job = await self.redis_pool.enqueue_job(
                 job_name,
-                **job_data,
+                job_data,
                 _job_id=job_id,
                 _defer_by=delay,
                 _max_retries=max_retries
             )
-            return job.job_id
+            if job is not None and delay is None:
+                # Wake a blocked StreamWorker immediately instead of waiting
+                # out its poll interval. Best-effort: the fallback scan still
+                # picks the job up if the XADD fails.
+                try:
+                    await self.redis_pool.xadd(
+                        _STREAM_KEY,
+                        {"job_id": job.job_id},
+                        maxlen=_STREAM_MAXLEN,
+                        approximate=True,
+                    )
+                except Exception as e:
+                    logger.warning(f"Stream wakeup failed for {job.job_id}: {e}")
+            # arq returns None when a job with this id is already queued or
+            # holds a recent result: the duplicate collapsed onto it
+            return job.job_id if job is not None else job_id
         except Exception as e:
             logger.error(f"Failed to enqueue job {job_name}: {e}")
             raise
     
+    @staticmethod
+    def _content_job_id(job_name: str, job_data: Any) -> str:
+        """Derive a stable job id from the payload content"""
+        digest = hashlib.blake2b(
+            orjson.dumps(job_data, option=orjson.OPT_SORT_KEYS),
+            digest_size=16,
+        ).hexdigest()
+        return f"{job_name}:{digest}"
+    
+    def _pin_status(self, job_id: str, status: Dict[str, Any]):
+        """Cache a terminal status; completed results are immutable"""
+        if len(self._status_cache) >= _STATUS_CACHE_MAX:
+            self._status_cache.clear()
+        self._status_cache[job_id] = status
+    
+    def _status_from_raw(self, job_id: str, raw: Optional[bytes]) -> Dict[str, Any]:
+        """Build the public status dict from a raw arq result payload"""
+        if raw is None:
+            return {"job_id": job_id, "status": "pending", "result": None}
+        
+        try:
+            info = deserialize_result(raw, deserializer=_job_deserializer)
+        except Exception as e:
+            logger.error(f"Failed to decode job result {job_id}: {e}")
+            return {"job_id": job_id, "status": "error", "error": str(e)}
+        
+        if info.success:
+            status = {"job_id": job_id, "status": "completed", "result": info.result}
+            self._pin_status(job_id, status)
+            return status
+        return {"job_id": job_id, "status": "error", "error": str(info.result)}
+    
     async def get_job_status(self, job_id: str) -> Dict[str, Any]:
         """Get job status"""
+        cached = self._status_cache.get(job_id)
+        if cached is not None:
+            return cached
+        
         if not self.redis_pool:
             await self.initialize()
         
         try:
-            job = await self.redis_pool.get_job_result(job_id)
-            return {
-                "job_id": job_id,
-                "status": "completed" if job else "pending",
-                "result": job if job else None
-            }
+            raw = await self.redis_pool.get(f"{result_key_prefix}{job_id}")
         except Exception as e:
             logger.error(f"Failed to get job status {job_id}: {e}")
             return {"job_id": job_id, "status": "error", "error": str(e)}
+        return self._status_from_raw(job_id, raw)
+    
+    async def get_job_statuses(self, job_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get statuses for many jobs at once
+        
+        All result keys are fetched with a single MGET and decoded locally,
+        so polling N jobs costs one round-trip however many finished.
+        """
+        if not self.redis_pool:
+            await self.initialize()
+        
+        statuses: Dict[str, Dict[str, Any]] = {}
+        missing = []
+        for job_id in job_ids:
+            cached = self._status_cache.get(job_id)
+            if cached is not None:
+                statuses[job_id] = cached
+            else:
+                missing.append(job_id)
+
+        if missing:
+            try:
+                raws = await self.redis_pool.mget(
+                    *(f"{result_key_prefix}{job_id}" for job_id in missing)
+                )
+            except Exception as e:
+                logger.error(f"Failed to batch-check job results: {e}")
+                raws = [None] * len(missing)
+
+            for job_id, raw in zip(missing, raws):
+                statuses[job_id] = self._status_from_raw(job_id, raw)
+
+        return [statuses[job_id] for job_id in job_ids]
     
     async def close(self):
         """Close ARQ connection pool"""
@@ -163,25 +293,66 @@ async def enrichment_job(ctx, app_data: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 
+# Fan-out enqueues are grouped so a huge batch does not hold thousands of
+# pending enqueue coroutines in memory at once.
+_FANOUT_CHUNK_SIZE = 1000
+
+
 async def batch_enrichment_job(ctx, batch_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Background job for batch enrichment processing
+
+    With fan_out=True the batch is split into individual enrichment_job
+    entries enqueued through the worker's own Redis connection, letting
+    idle workers drain the batch in parallel instead of one worker
+    processing it serially.
     """
     apps = batch_data.get("apps", [])
     logger.info(f"Processing batch enrichment job: {len(apps)} apps")
+
+    if batch_data.get("fan_out"):
+        redis = ctx["redis"]
+        enqueued = 0
+        errors = 0
+        for start in range(0, len(apps), _FANOUT_CHUNK_SIZE):
+            chunk = apps[start:start + _FANOUT_CHUNK_SIZE]
+            results = await asyncio.gather(
+                *(redis.enqueue_job("enrichment_job", app_data=app) for app in chunk),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to fan out app in batch: {result}")
+                    errors += 1
+                else:
+                    enqueued += 1
+        return {
+            "status": "fanned_out",
+            "enqueued_count": enqueued,
+            "error_count": errors,
+            "processed_at": datetime.utcnow().isoformat(),
+        }
+    
+    # Direct processing saves queue overhead for moderate batches; the jobs
+    # are network-bound CVE lookups, so run them concurrently under a
+    # semaphore that keeps us below upstream API rate limits
+    limit = min(int(getattr(settings, "max_concurrent_requests", 32)) or 32, 64)
+    sem = asyncio.Semaphore(limit)
+    
+    async def _run(app):
+        async with sem:
+            return await enrichment_job(ctx, app)
+    
+    results = await asyncio.gather(*(_run(app) for app in apps), return_exceptions=True)
     
     processed_count = 0
     errors = 0
-    
-    for app in apps:
-        try:
-            # We can reusing the logic by calling enqueue or directly processing
-            # Processing directly to save queue overhead for batch
-            await enrichment_job(ctx, app)
-            processed_count += 1
-        except Exception as e:
-            logger.error(f"Failed to process app in batch: {e}")
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error(f"Failed to process app in batch: {result}")
             errors += 1
+        else:
+            processed_count += 1
     
     return {
         "status": "completed",
@@ -191,6 +362,57 @@ async def batch_enrichment_job(ctx, batch_data: Dict[str, Any]) -> Dict[str, Any
     }
 
 
+class StreamWorker(Worker):
+    """
+    ARQ worker with push-style job pickup via Redis Streams
+
+    Stock ARQ polls the queue sorted set every poll_delay (500ms), which
+    puts a latency floor on every job and burns Redis ops across idle
+    workers. This subclass blocks on XREADGROUP instead: enqueue_job XADDs
+    a wakeup entry, so ready jobs are claimed within milliseconds. The
+    sorted set remains the source of truth, so delayed jobs and entries
+    whose wakeup was lost are still found by the fallback scan that runs
+    whenever the blocking read times out.
+    """
+
+    # Upper bound on how long a delayed/lost job waits for the fallback scan
+    _block_seconds = 5.0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._consumer = f"worker-{os.getpid()}"
+        self._group_ready = False
+
+    async def _ensure_group(self):
+        if self._group_ready:
+            return
+        try:
+            await self.pool.xgroup_create(_STREAM_KEY, _STREAM_GROUP, id="0", mkstream=True)
+        except Exception:
+            # BUSYGROUP: another worker already created it
+            pass
+        self._group_ready = True
+
+    async def _poll_iteration(self) -> None:
+        try:
+            await self._ensure_group()
+            entries = await self.pool.xreadgroup(
+                groupname=_STREAM_GROUP,
+                consumername=self._consumer,
+                streams={_STREAM_KEY: ">"},
+                count=self.max_jobs,
+                block=int(self._block_seconds * 1000),
+            )
+            if entries:
+                ids = [entry_id for _, batch in entries for entry_id, _ in batch]
+                await self.pool.xack(_STREAM_KEY, _STREAM_GROUP, *ids)
+        except Exception as e:
+            logger.error(f"Stream read failed, falling back to polling: {e}")
+        # The sorted set does the actual claiming, so ARQ's per-job locks,
+        # retries and result storage all behave exactly as stock.
+        await super()._poll_iteration()
+
+
 # ARQ worker functions mapping
 class WorkerFunctions:
     """ARQ worker function registry"""
@@ -202,10 +424,29 @@ class WorkerFunctions:
     
     on_startup = startup
     on_shutdown = shutdown
+    
+    # Job payloads are plain dicts of strings/numbers and results are
+    # (potentially large) CVE record lists - orjson encodes them several
+    # times faster and more compactly than the pickle default
+    job_serializer = staticmethod(_job_serializer)
+    job_deserializer = staticmethod(_job_deserializer)
+
+
+def create_stream_worker(**kwargs) -> StreamWorker:
+    """Build a StreamWorker wired to this module's job registry"""
+    return StreamWorker(
+        functions=WorkerFunctions.functions,
+        on_startup=startup,
+        on_shutdown=shutdown,
+        job_serializer=_job_serializer,
+        job_deserializer=_job_deserializer,
+        **kwargs,
+    )
 
 
 # Global job queue instance
 _job_queue: Optional[JobQueue] = None
+_job_queue_lock = asyncio.Lock()
 
 
 async def get_job_queue() -> JobQueue:
@@ -213,8 +454,13 @@ async def get_job_queue() -> JobQueue:
     global _job_queue
     
     if _job_queue is None:
-        _job_queue = JobQueue()
-        await _job_queue.initialize()
+        async with _job_queue_lock:
+            if _job_queue is None:
+                queue = JobQueue()
+                await queue.initialize()
+                # Publish only after initialize succeeds so a failed init
+                # is retried by the next caller
+                _job_queue = queue
     
     return _job_queue
 
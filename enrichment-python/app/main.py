@@ -1,14 +1,20 @@
 import contextlib
+import hashlib
+import os
+import orjson
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List, Dict
+from pydantic import BaseModel, ConfigDict
+from typing import List, Dict, Optional
 
 # Unified Architecture Imports
 from .core.config import settings
 from .core.logging import configure_logging, get_logger
 from .services.enrichment import enrichment_service
+from .core.cache import cache_manager
+from .jobs import get_job_queue
 from .routes.admin import router as admin_router
 
 # Configure Logger (structlog)
@@ -36,9 +42,20 @@ app = FastAPI(
     title=settings.app_name,
     version="2.0.0", # Bump for Enterprise Release
     lifespan=lifespan,
-    debug=settings.debug
+    debug=settings.debug,
+    default_response_class=ORJSONResponse
 )
 
+# --- Request Models ---
+
+class SoftwareItem(BaseModel):
+    """One software entry to enrich; extra keys are passed through untouched"""
+    model_config = ConfigDict(extra="allow")
+
+    name: str
+    version: Optional[str] = ""
+    vendor: Optional[str] = ""
+
 # Middleware
 app.add_middleware(
     CORSMiddleware,
@@ -82,7 +99,7 @@ async def health_check():
     }
 
 @app.post("/enrich/software")
-async def enrich_software(software_list: List[Dict]):
+async def enrich_software(software_list: List[SoftwareItem]):
     """
     Main Enrichment Endpoint
     Accepts list of software items: [{"name": "nginx", "version": "1.18", "vendor": "nginx"}]
@@ -94,17 +111,71 @@ async def enrich_software(software_list: List[Dict]):
     if len(software_list) > settings.max_concurrent_requests:
         raise HTTPException(status_code=400, detail=f"Batch size limit exceeded ({settings.max_concurrent_requests})")
 
+    items = [item.model_dump() for item in software_list]
+
+    # Repeat queries for the same software set return the cached
+    # pre-encoded body without re-enriching or re-serializing
+    payload_key = "enrich:response:" + hashlib.blake2b(
+        orjson.dumps(items, option=orjson.OPT_SORT_KEYS), digest_size=16
+    ).hexdigest()
+    cached = await cache_manager.get_raw(payload_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     try:
-        results = await enrichment_service.enrich_software(software_list)
-        return {
+        results = await enrichment_service.enrich_software(items)
+        body = orjson.dumps({
             "success": True,
             "count": len(results),
             "data": results
-        }
+        })
+        await cache_manager.set_raw(payload_key, body.decode(), ttl=300)
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         logger.error("Enrichment API failed", error=str(e))
         raise HTTPException(status_code=500, detail="Internal Server Error")
 
+@app.post("/enrich/batch")
+async def enrich_batch(software_list: List[SoftwareItem]):
+    """
+    Batch Enrichment Endpoint (async)
+    Enqueues the batch on the ARQ worker pool and returns a job id;
+    poll /enrich/status/{job_id} for the result. Unlike in-process
+    background tasks, queued jobs survive pod restarts and retry.
+    """
+    if not software_list:
+        raise HTTPException(status_code=400, detail="Empty software list")
+
+    try:
+        queue = await get_job_queue()
+        job_id = await queue.enqueue_job(
+            "batch_enrichment_job",
+            {"apps": [item.model_dump() for item in software_list]}
+        )
+        return {"job_id": job_id, "status": "queued"}
+    except Exception as e:
+        logger.error("Batch enqueue failed", error=str(e))
+        raise HTTPException(status_code=500, detail="Internal Server Error")
+
+@app.get("/enrich/status/{job_id}")
+async def enrich_status(job_id: str):
+    """Job status endpoint for batch enrichment"""
+    try:
+        queue = await get_job_queue()
+        return await queue.get_job_status(job_id)
+    except Exception as e:
+        logger.error("Status lookup failed", error=str(e))
+        raise HTTPException(status_code=500, detail="Internal Server Error")
+
+@app.get("/integrations/report")
+def integrations_report():
+    """SIEM/SOAR integration status report"""
+    # Memory-only computation: a sync def endpoint skips the coroutine
+    # machinery, and the hub serves pre-encoded JSON bytes.
+    # Import here to keep app startup free of the integrations stack.
+    from .integrations.siem_integration import get_hub
+    return Response(content=get_hub().get_report_bytes(), media_type="application/json")
+
 # --- Training / Admin Routes (Optional, protected in prod) ---
 
 @app.post("/admin/migrate")
@@ -117,9 +188,22 @@ async def trigger_migration(background_tasks: BackgroundTasks):
 
 if __name__ == "__main__":
     # Use settings for host/port
-    uvicorn.run(
-        "app.main:app", 
-        host=settings.enrichment_host, 
-        port=settings.enrichment_port,
-        reload=settings.debug
-    )
+    if settings.debug:
+        # Auto-reload forces a single worker, so keep dev defaults
+        uvicorn.run(
+            "app.main:app", 
+            host=settings.enrichment_host, 
+            port=settings.enrichment_port,
+            reload=True
+        )
+    else:
+        # uvloop event loop + httptools parser (both ship with
+        # uvicorn[standard]) and one worker per core
+        uvicorn.run(
+            "app.main:app", 
+            host=settings.enrichment_host, 
+            port=settings.enrichment_port,
+            loop="uvloop",
+            http="httptools",
+            workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+        )
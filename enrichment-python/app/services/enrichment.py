@@ -69,6 +69,12 @@ class EnrichmentService:
         4. External NVD API (Fallback)
         """
         results = []
+        # Batch-prefetch all cache keys in one MGET round-trip; hits land in
+        # the L1 cache, so the per-item lookups below are memory-only
+        await cache_manager.get_many([
+            f"enrich:{i.get('name', '')}:{i.get('version', '')}:{i.get('vendor', '')}"
+            for i in software_list
+        ])
         # Process in parallel with semaphore
         tasks = [self._enrich_single_item(item) for item in software_list]
         enriched_items = await asyncio.gather(*tasks, return_exceptions=True)
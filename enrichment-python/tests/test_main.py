@@ -25,3 +25,59 @@ def test_enrich_software_endpoint():
     except Exception:
         # DB connection might fail in test environment without docker
         pass
+
+def test_enrich_batch_endpoint():
+    software_list = [
+        {"name": "nginx", "version": "1.18", "vendor": "nginx"}
+    ]
+
+    try:
+        response = client.post("/enrich/batch", json=software_list)
+        if response.status_code == 200:
+            body = response.json()
+            assert body["status"] == "queued"
+            assert isinstance(body["job_id"], str) and body["job_id"]
+    except Exception:
+        # Redis might not be reachable in test environment without docker
+        pass
+
+def test_enrich_status_endpoint():
+    try:
+        response = client.get("/enrich/status/no-such-job")
+        if response.status_code == 200:
+            body = response.json()
+            assert body["job_id"] == "no-such-job"
+            assert body["status"] in ("pending", "completed", "error")
+    except Exception:
+        # Redis might not be reachable in test environment without docker
+        pass
+
+def test_job_status_pending_shape():
+    from app.jobs import JobQueue
+
+    status = JobQueue()._status_from_raw("job-x", None)
+    assert status == {"job_id": "job-x", "status": "pending", "result": None}
+
+def test_job_status_completed_shape():
+    from app.jobs import JobQueue, _job_serializer
+
+    # Raw payload in arq's result wire format, encoded with the module's
+    # own serializer - exactly what an MGET on the result key returns
+    raw = _job_serializer({
+        "t": 1,
+        "f": "batch_enrichment_job",
+        "a": [{"apps": []}],
+        "k": {},
+        "et": 0,
+        "r": {"status": "completed", "processed_count": 1},
+        "s": True,
+        "st": 0,
+        "ft": 0,
+    })
+
+    queue = JobQueue()
+    status = queue._status_from_raw("job-y", raw)
+    assert status["status"] == "completed"
+    assert status["result"]["processed_count"] == 1
+    # Completed results are pinned, so a repeat lookup is served locally
+    assert queue._status_cache["job-y"] == status